@@ -0,0 +1,129 @@
+"""File handler and queue listener behind `configure_logging`.
+
+`RotationAwareFileHandler` is the one handler that writes the log file;
+`BatchingQueueListener` owns it when the background writer is enabled.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import weakref
+from logging.handlers import QueueListener, WatchedFileHandler
+from typing import Any
+
+from instrukt_ai_logging._inotify import ROTATION_EVENTS, Inotify
+
+_rotation_aware_handlers: weakref.WeakSet[RotationAwareFileHandler] = weakref.WeakSet()
+
+
+# Userspace buffer for the background writer's file; one write(2) per burst.
+_WRITE_BUFFER_BYTES = 65536
+
+
+class RotationAwareFileHandler(WatchedFileHandler):
+    """`WatchedFileHandler` that learns about rotation from inotify instead of stat.
+
+    The base class stats the log path on every emit. On Linux this handler watches
+    the open file and only runs the stat-and-reopen check after the kernel reports
+    a rename/unlink; elsewhere, or when inotify is unavailable, it behaves exactly
+    like `WatchedFileHandler`.
+
+    With `defer_flush=True` the file gets a 64 KiB userspace buffer and `flush()`
+    becomes a no-op; the owner calls `flush_batch()` once a burst is written, and
+    `stop_deferring()` when it stops batching.
+    """
+
+    def __init__(
+        self, filename: str | os.PathLike[str], encoding: str | None = None, *, defer_flush: bool = False
+    ) -> None:
+        self._defer_flush = defer_flush  # read by `_open`, which the base __init__ calls
+        super().__init__(filename, encoding=encoding)
+        self._watch = Inotify.open(self.baseFilename, ROTATION_EVENTS)
+        self._check_pending = False
+        _rotation_aware_handlers.add(self)
+
+    def reopenIfNeeded(self) -> None:
+        watch = self._watch
+        if watch is None:
+            super().reopenIfNeeded()
+            return
+        if not watch.drain() and not self._check_pending:
+            return
+        self._check_pending = False
+        super().reopenIfNeeded()
+        if not watch.rewatch(self.baseFilename):
+            watch.close()
+            self._watch = None
+
+    def _open(self) -> Any:
+        if not self._defer_flush:
+            return super()._open()
+        return open(
+            self.baseFilename, self.mode, buffering=_WRITE_BUFFER_BYTES, encoding=self.encoding, errors=self.errors
+        )
+
+    def flush(self) -> None:
+        if not self._defer_flush:
+            super().flush()
+
+    def flush_batch(self) -> None:
+        super().flush()
+
+    def stop_deferring(self) -> None:
+        """Flush what is buffered and flush after every record from now on."""
+        self.acquire()
+        try:
+            self._defer_flush = False
+            super().flush()
+        finally:
+            self.release()
+
+    def _reset_watch(self) -> None:
+        # A forked child shares the parent's inotify fd; whichever process read the
+        # events first would hide a rotation from the other. Give the child its own.
+        if self._watch is not None:
+            self._watch.close()
+        self._watch = Inotify.open(self.baseFilename, ROTATION_EVENTS)
+        self._check_pending = True
+
+    def close(self) -> None:
+        if self._watch is not None:
+            self._watch.close()
+            self._watch = None
+        _rotation_aware_handlers.discard(self)
+        super().close()
+
+
+def _reset_rotation_watches_after_fork() -> None:
+    for handler in list(_rotation_aware_handlers):
+        handler._reset_watch()  # pyright: ignore[reportPrivateUsage]
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_rotation_watches_after_fork)
+
+
+class BatchingQueueListener(QueueListener):
+    """`QueueListener` that flushes its file handler whenever the queue runs dry.
+
+    A burst of records is written into the handler's buffer and reaches the file
+    in one flush once the writer catches up, instead of one write(2) per record.
+    """
+
+    def __init__(self, record_queue: queue.SimpleQueue[logging.LogRecord], handler: RotationAwareFileHandler) -> None:
+        super().__init__(record_queue, handler, respect_handler_level=True)
+        self._record_queue = record_queue
+        self.file_handler = handler
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self._record_queue.empty():
+            try:
+                self.file_handler.flush_batch()
+            except Exception:
+                # This flush runs outside `emit`, so route errors (ENOSPC, EIO) to
+                # `handleError` as `StreamHandler.emit` would; letting them escape
+                # would end the listener thread and strand every later record.
+                self.file_handler.handleError(record)
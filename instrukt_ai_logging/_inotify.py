@@ -0,0 +1,118 @@
+"""Minimal inotify binding over libc (Linux only, stdlib only).
+
+Shared by the rotation-aware file handler, which watches its open log file for
+rename/unlink, and the `instrukt-ai-logs --follow` reader, which also wakes on
+appends. Everywhere else `Inotify.open` returns None and callers fall back to
+stat/sleep.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import functools
+import os
+import select
+import sys
+import weakref
+
+# inotify event bits (<sys/inotify.h>). A rotated-away file sees IN_MOVE_SELF
+# (rename) or IN_ATTRIB (unlink drops its link count while we hold it open).
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+
+
+@functools.cache
+def _libc() -> ctypes.CDLL | None:
+    """Return libc with inotify prototypes set, or None where inotify is unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        init1, add_watch, rm_watch = libc.inotify_init1, libc.inotify_add_watch, libc.inotify_rm_watch
+    except (OSError, AttributeError):
+        return None
+    init1.argtypes, init1.restype = [ctypes.c_int], ctypes.c_int
+    add_watch.argtypes, add_watch.restype = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32], ctypes.c_int
+    rm_watch.argtypes, rm_watch.restype = [ctypes.c_int, ctypes.c_int], ctypes.c_int
+    return libc
+
+
+class Inotify:
+    """Non-blocking inotify watch on a single path (Linux, via libc; stdlib only)."""
+
+    def __init__(self, libc: ctypes.CDLL, fd: int, mask: int) -> None:
+        self._libc = libc
+        self._fd = fd
+        self._mask = mask
+        self._wd = -1
+        # A zero-timeout poll is the cheapest "anything pending?" probe: no path
+        # lookup like stat, and no BlockingIOError raised like a bare read.
+        self._poller = select.poll()
+        self._poller.register(fd, select.POLLIN)
+        # A bare fd has no finalizer of its own: close it when the watch is
+        # garbage-collected, so a dropped watch cannot pin an inotify instance
+        # (max_user_instances is a small per-user limit). Runs at most once.
+        self._closer = weakref.finalize(self, _close_fd, fd)
+
+    @classmethod
+    def open(cls, path: str, mask: int) -> Inotify | None:
+        """Watch `path` for `mask` events; None if inotify is unavailable or the watch fails."""
+        libc = _libc()
+        if libc is None:
+            return None
+        fd = int(libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC))
+        if fd < 0:
+            return None
+        watch = cls(libc, fd, mask)
+        if not watch.rewatch(path):
+            watch.close()
+            return None
+        return watch
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def rewatch(self, path: str) -> bool:
+        """Move the watch to whatever inode `path` names now (e.g. after a reopen)."""
+        wd = int(self._libc.inotify_add_watch(self._fd, os.fsencode(path), self._mask))
+        if wd < 0:
+            return False
+        if self._wd >= 0 and self._wd != wd:
+            # The old inode's watch may already be gone (IN_IGNORED); failure is harmless.
+            self._libc.inotify_rm_watch(self._fd, self._wd)
+        self._wd = wd
+        return True
+
+    def drain(self) -> bool:
+        """Consume all pending events; return True if there were any."""
+        if not self._poller.poll(0):
+            return False
+        while True:
+            try:
+                if not os.read(self._fd, 4096):
+                    return True
+            except BlockingIOError:
+                return True
+
+    def wait(self, timeout: float) -> bool:
+        """Block up to `timeout` seconds for events; consume them and return True if any."""
+        if not self._poller.poll(timeout * 1000):
+            return False
+        return self.drain()
+
+    def close(self) -> None:
+        self._closer()
+
+
+def _close_fd(fd: int) -> None:
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+
+
+ROTATION_EVENTS = IN_MOVE_SELF | IN_DELETE_SELF | IN_ATTRIB
+# What a tail-style reader (`instrukt-ai-logs --follow`) wakes on: appends plus rotation.
+FOLLOW_EVENTS = IN_MODIFY | ROTATION_EVENTS
@@ -0,0 +1,273 @@
+"""Reading the `--since` window back out of log files.
+
+Lines start with the fixed-width UTC timestamp `UtcMillisFormatter` writes, so
+readers select and merge lines by comparing that prefix as text. The public
+functions are re-exported from `instrukt_ai_logging.logging`.
+"""
+
+from __future__ import annotations
+
+import gzip
+import heapq
+import os
+import re
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import BinaryIO
+
+
+def _now_utc() -> datetime:
+    return datetime.now(tz=UTC)
+
+
+# Canonical leading timestamp written by `UtcMillisFormatter`: YYYY-MM-DDTHH:MM:SS.mmmZ
+_TIMESTAMP_LEN = 24
+
+
+def _has_canonical_timestamp(line: str) -> bool:
+    return (
+        len(line) >= _TIMESTAMP_LEN
+        and line[23] == "Z"
+        and line[4] == "-"
+        and line[10] == "T"
+        and line[19] == "."
+        and (len(line) == _TIMESTAMP_LEN or line[_TIMESTAMP_LEN].isspace())
+    )
+
+
+def parse_log_timestamp(line: str) -> datetime | None:
+    """Parse the timestamp at the start of a standard log line.
+
+    Expected: YYYY-MM-DDTHH:MM:SS.mmmZ ...
+    """
+    if _has_canonical_timestamp(line):
+        try:
+            return datetime(
+                int(line[0:4]),
+                int(line[5:7]),
+                int(line[8:10]),
+                int(line[11:13]),
+                int(line[14:16]),
+                int(line[17:19]),
+                int(line[20:23]) * 1000,
+                tzinfo=UTC,
+            )
+        except ValueError:
+            return None
+
+    # Any other ISO-8601 shape ending in Z (e.g. no milliseconds) takes the generic path.
+    token = line.split(" ", 1)[0].strip()
+    if not token.endswith("Z"):
+        return None
+    try:
+        # Python doesn't accept 'Z' directly in fromisoformat.
+        return datetime.fromisoformat(token.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _canonical_stamp(dt: datetime) -> str:
+    """Return `dt` in the canonical leading-timestamp form YYYY-MM-DDTHH:MM:SS.mmmZ."""
+    utc = dt.astimezone(UTC)
+    return utc.strftime("%Y-%m-%dT%H:%M:%S.") + f"{utc.microsecond // 1000:03d}Z"
+
+
+def _timestamp_key(line: str) -> str | None:
+    """Return a sortable key for the line's leading timestamp, or None.
+
+    The canonical timestamp is fixed-width, so its text sorts chronologically:
+    readers compare the line's first 24 characters against a precomputed cutoff
+    stamp, and no `datetime` or `int` is built for canonical lines.
+    """
+    if _has_canonical_timestamp(line):
+        return line[:_TIMESTAMP_LEN]
+    ts = parse_log_timestamp(line)
+    return None if ts is None else _canonical_stamp(ts)
+
+
+# A canonical timestamp at the start of a line. Fixed-width ISO-8601 UTC sorts
+# lexicographically in time order, so matches compare against the cutoff as bytes.
+_TIMESTAMPED_LINE_RE = re.compile(rb"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z)(?=\s|$)", re.MULTILINE)
+
+
+def iter_recent_log_lines(log_file: Path, since: timedelta) -> Iterator[str]:
+    """Yield log lines newer than now-`since`, reading rotated siblings when present.
+
+    Siblings are read oldest first. A sibling last modified before the cutoff holds
+    no in-window line and is skipped; within the rest, reading starts at
+    `_window_start_offset` rather than byte 0, so work scales with the window.
+    """
+    cutoff = _now_utc() - since
+    cutoff_key = _canonical_stamp(cutoff)
+    cutoff_stamp = cutoff_key.encode("ascii")
+
+    # One scandir pass yields names plus cached file-type/stat data, instead of a
+    # glob followed by a separate is_file() and stat() per candidate.
+    prefix = log_file.name
+    candidates: list[tuple[float, str]] = []
+    try:
+        with os.scandir(log_file.parent) as entries:
+            for entry in entries:
+                if not entry.name.startswith(prefix) or entry.name.endswith(".gz"):
+                    continue
+                try:
+                    if entry.is_file():
+                        candidates.append((entry.stat().st_mtime, entry.path))
+                except FileNotFoundError:
+                    continue
+    except FileNotFoundError:
+        return
+    candidates.sort(key=lambda item: item[0])
+
+    cutoff_ts = cutoff.timestamp()
+    for mtime, path in candidates:
+        if mtime < cutoff_ts:
+            continue
+        try:
+            fb = open(path, "rb")
+        except FileNotFoundError:
+            continue
+        with fb:
+            offset = _window_start_offset(path, cutoff_key)
+            if offset:
+                fb.seek(offset)
+                fb.readline()  # skip the partial line at the seek boundary
+            yield from _scan_timestamped_lines(fb, cutoff_stamp)
+
+
+# Bytes read per `_scan_timestamped_lines` step.
+_SCAN_CHUNK_BYTES = 1048576  # 1 MiB
+
+
+def _scan_timestamped_lines(fb: BinaryIO, cutoff_stamp: bytes) -> Iterator[str]:
+    """Yield timestamped lines from `fb`'s position on whose stamp is >= `cutoff_stamp`.
+
+    The line scan runs inside `re` over 1 MiB reads: only timestamped line starts
+    are visited, and each is checked with one bytes comparison. Plain reads (not
+    `mmap`) keep a file truncated mid-scan — `: > app.log`, logrotate's
+    `copytruncate` — an early end of input rather than a SIGBUS in the host.
+    """
+    pending = b""
+    while True:
+        chunk = fb.read(_SCAN_CHUNK_BYTES)
+        if chunk:
+            data = pending + chunk
+            cut = data.rfind(b"\n") + 1
+            if cut == 0:
+                pending = data
+                continue
+            block, pending = data[:cut], data[cut:]
+        else:
+            block, pending = pending, b""
+        for match in _TIMESTAMPED_LINE_RE.finditer(block):
+            if match.group(1) < cutoff_stamp:
+                continue
+            end = block.find(b"\n", match.end())
+            end = len(block) if end < 0 else end + 1
+            yield block[match.start() : end].decode("utf-8", errors="replace")
+        if not chunk:
+            return
+
+
+# Initial backward-probe size for locating the start of the --since window in a
+# large file. A typical multi-minute window fits in one or two probes; the probe
+# doubles when the window is larger, so worst case is still O(window), not O(file).
+_WINDOW_PROBE_BYTES = 262144  # 256 KiB
+
+
+def _window_start_offset(path: str, cutoff_key: str) -> int:
+    """Return a byte offset at or before the first line newer than `cutoff_key`.
+
+    A log file is appended in timestamp order, so the window's start can be found
+    by probing backward from EOF in exponentially growing chunks instead of
+    scanning from byte 0: once a probe's earliest timestamped line is already
+    older than the cutoff, the window begins within that probe and everything
+    before it is skippable. Returns 0 when the window spans the whole file (or the
+    file is smaller than a single probe), which reproduces a full forward scan.
+    """
+    try:
+        size = os.stat(path).st_size
+    except OSError:
+        return 0
+    if size <= _WINDOW_PROBE_BYTES:
+        return 0
+
+    probe = _WINDOW_PROBE_BYTES
+    with open(path, "rb") as fb:
+        while probe < size:
+            start = size - probe
+            fb.seek(start)
+            fb.readline()  # discard the partial line spanning the probe boundary
+            first_key: str | None = None
+            for raw in fb:
+                first_key = _timestamp_key(raw.decode("utf-8", errors="replace"))
+                if first_key is not None:
+                    break
+            if first_key is not None and first_key < cutoff_key:
+                return start
+            probe *= 2
+    return 0
+
+
+def iter_recent_log_lines_merged(files: Iterable[Path], since: timedelta) -> Iterator[str]:
+    """Yield lines newer than now-`since` merged across multiple files by timestamp.
+
+    Each file is read independently; lines without a parsable leading timestamp
+    inherit the previous parsed timestamp from their own file (so multi-line
+    entries stay adjacent to their parent). The resulting per-file streams are
+    merged via a k-way heap merge, producing a single chronologically-ordered
+    output stream.
+
+    Files whose mtime falls before the cutoff are skipped entirely — no line
+    inside them can be newer than the file itself, so reading them only burns
+    I/O. This matters for log directories with large rotation history or
+    sibling streams (git-wrapper.log, etc.) the caller didn't explicitly
+    request via `--logs`.
+    """
+    cutoff = _now_utc() - since
+    cutoff_key = _canonical_stamp(cutoff)
+
+    def _file_stream(path: str) -> Iterator[tuple[str, str]]:
+        is_gzip = path.endswith(".gz")
+        try:
+            fb = gzip.open(path, "rb") if is_gzip else open(path, "rb")
+        except FileNotFoundError:
+            return
+        try:
+            # Gzip streams cannot use the raw byte probe; stream eligible archives from member start.
+            offset = 0 if is_gzip else _window_start_offset(path, cutoff_key)
+            if offset:
+                fb.seek(offset)
+                fb.readline()  # discard the partial line at the seek boundary
+            last_key: str | None = None
+            for raw in fb:
+                line = raw.decode("utf-8", errors="replace")
+                key = _timestamp_key(line)
+                if key is None:
+                    if last_key is None or last_key < cutoff_key:
+                        continue
+                    yield (last_key, line)
+                    continue
+                last_key = key
+                if key < cutoff_key:
+                    continue
+                yield (key, line)
+        finally:
+            fb.close()
+
+    # Work with the `str` form of each path: `os` calls skip the pathlib wrappers.
+    cutoff_ts = cutoff.timestamp()
+    eligible: list[str] = []
+    for path in map(os.fspath, files):
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            continue
+        if mtime < cutoff_ts:
+            continue
+        eligible.append(path)
+
+    streams = [_file_stream(p) for p in eligible]
+    for _, line in heapq.merge(*streams, key=lambda item: item[0]):
+        yield line
@@ -3,18 +3,69 @@ from __future__ import annotations
 import argparse
 import os
 import re
+import select
 import sys
 import threading
 import time
 from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
+from instrukt_ai_logging._inotify import FOLLOW_EVENTS, Inotify
 from instrukt_ai_logging.logging import (
     iter_recent_log_lines_merged,
     parse_since,
     resolve_log_files,
 )
 
+# One read(2) pulls up to this many bytes; lines are split out of the buffer.
+_FOLLOW_READ_BYTES = 65536
+
+
+class _ChangeWaiter:
+    """Sleep until the followed file changes, or at most `timeout` seconds.
+
+    Linux waits on inotify and macOS on kqueue, so a quiet log costs no periodic
+    wakeups and an append is seen within milliseconds. Elsewhere, or when neither
+    is available, it is a plain sleep.
+    """
+
+    def __init__(self) -> None:
+        self._inotify: Inotify | None = None
+        self._kqueue: Any = None
+
+    def arm(self, log_path: str, fd: int) -> None:
+        """Watch the file just opened as `fd`; call again after every reopen."""
+        self.close()
+        if sys.platform == "darwin":
+            kq = select.kqueue()
+            event = select.kevent(
+                fd,
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND | select.KQ_NOTE_RENAME | select.KQ_NOTE_DELETE,
+            )
+            kq.control([event], 0, 0)
+            self._kqueue = kq
+        else:
+            self._inotify = Inotify.open(log_path, FOLLOW_EVENTS)
+
+    def wait(self, timeout: float) -> None:
+        if self._inotify is not None:
+            self._inotify.wait(timeout)
+        elif self._kqueue is not None:
+            self._kqueue.control(None, 1, timeout)
+        else:
+            time.sleep(timeout)
+
+    def close(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        if self._kqueue is not None:
+            self._kqueue.close()
+            self._kqueue = None
+
 
 def iter_follow_lines(
     log_file: Path,
@@ -28,13 +79,21 @@ def iter_follow_lines(
 
     - Detects rotation (inode change) and truncation.
     - Waits for file creation if it doesn't exist yet.
+    - Reads raw 64 KiB chunks and yields only complete lines; a partially
+      written line is held back until its newline arrives.
+    - Waits for appends in the kernel (inotify/kqueue) where available;
+      `poll_interval_s` then only bounds how long a wait may last.
     - `max_lines`/`max_seconds` are mainly for tests.
     """
     deadline = None if max_seconds is None else (time.monotonic() + max_seconds)
     emitted = 0
+    # Stat/open the `str` form directly; this runs on every idle wakeup.
+    log_path = os.fspath(log_file)
 
-    f = None
+    fd: int | None = None
     inode = None
+    buf = bytearray()
+    waiter = _ChangeWaiter()
     start_at_end_for_next_open = start_at_end
 
     try:
@@ -42,58 +101,66 @@ def iter_follow_lines(
             if deadline is not None and time.monotonic() >= deadline:
                 return
 
-            if f is None:
+            newline = buf.find(b"\n")
+            if newline >= 0:
+                line = bytes(buf[: newline + 1])
+                del buf[: newline + 1]
+                yield line.decode("utf-8", errors="replace")
+                emitted += 1
+                if max_lines is not None and emitted >= max_lines:
+                    return
+                continue
+
+            if fd is None:
                 try:
-                    f = log_file.open("r", encoding="utf-8", errors="replace")
+                    fd = os.open(log_path, os.O_RDONLY | os.O_NONBLOCK | os.O_CLOEXEC)
                 except FileNotFoundError:
                     time.sleep(poll_interval_s)
                     continue
 
                 try:
-                    inode = os.fstat(f.fileno()).st_ino
+                    inode = os.fstat(fd).st_ino
                 except OSError:
                     inode = None
 
-                if start_at_end_for_next_open:
-                    f.seek(0, os.SEEK_END)
-                else:
-                    f.seek(0, os.SEEK_SET)
+                os.lseek(fd, 0, os.SEEK_END if start_at_end_for_next_open else os.SEEK_SET)
+                waiter.arm(log_path, fd)
 
                 # Only the first open may start at end; after rotation we read from start.
                 start_at_end_for_next_open = False
 
-            line = f.readline()
-            if line:
-                yield line
-                emitted += 1
-                if max_lines is not None and emitted >= max_lines:
-                    return
+            chunk = os.read(fd, _FOLLOW_READ_BYTES)
+            if chunk:
+                buf += chunk
                 continue
 
             # No new data: detect rotation/truncation and wait.
             try:
-                st = log_file.stat()
+                st = os.stat(log_path)
             except FileNotFoundError:
-                f.close()
-                f = None
-                inode = None
-                time.sleep(poll_interval_s)
-                continue
+                st = None
 
-            if inode is not None and getattr(st, "st_ino", None) is not None and st.st_ino != inode:
-                f.close()
-                f = None
+            if st is None or (inode is not None and st.st_ino != inode):
+                os.close(fd)
+                fd = None
                 inode = None
+                if buf:
+                    # The old file ended mid-line; emit what it had before moving on.
+                    buf += b"\n"
+                if st is None:
+                    time.sleep(poll_interval_s)
                 continue
 
-            if f.tell() > st.st_size:
-                f.seek(0, os.SEEK_SET)
+            if os.lseek(fd, 0, os.SEEK_CUR) > st.st_size:
+                os.lseek(fd, 0, os.SEEK_SET)
+                buf.clear()
 
-            time.sleep(poll_interval_s)
+            waiter.wait(poll_interval_s)
     finally:
-        if f is not None:
+        waiter.close()
+        if fd is not None:
             try:
-                f.close()
+                os.close(fd)
             except OSError:
                 pass
 
@@ -102,11 +169,34 @@ def _parse_stems(value: str) -> list[str]:
     return [item.strip() for item in value.split(",") if item.strip()]
 
 
-def _line_passes(line: str, *, keep: re.Pattern[str] | None, drop: re.Pattern[str] | None) -> bool:
+# Expressions made only of these characters mean the same as a regex and as a
+# literal, so they are matched with a substring test instead of `re.search`.
+# `.` is deliberately absent: as a regex it matches any character.
+_LITERAL_RE = re.compile(r"[\w\-/:@=,'\" ]+")
+
+_LineFilter = re.Pattern[str] | str
+
+
+def _compile_line_filter(expr: str) -> _LineFilter | None:
+    """Compile a `--grep`/`--exclude` expression, keeping plain literals as `str`."""
+    if not expr:
+        return None
+    if _LITERAL_RE.fullmatch(expr):
+        return expr
+    return re.compile(expr)
+
+
+def _line_matches(line: str, line_filter: _LineFilter) -> bool:
+    if isinstance(line_filter, str):
+        return line_filter in line
+    return line_filter.search(line) is not None
+
+
+def _line_passes(line: str, *, keep: _LineFilter | None, drop: _LineFilter | None) -> bool:
     """Apply the inclusive `--grep` keep filter then the `--exclude` drop filter."""
-    if keep is not None and not keep.search(line):
+    if keep is not None and not _line_matches(line, keep):
         return False
-    if drop is not None and drop.search(line):
+    if drop is not None and _line_matches(line, drop):
         return False
     return True
 
@@ -125,12 +215,17 @@ def _is_rotation_suffix(path: Path) -> bool:
     return idx > 0 and name[idx + len(".log") :] != ""
 
 
+# How long follow mode lets further lines pile up in the stdout buffer after a
+# write before flushing them together.
+_FOLLOW_FLUSH_DELAY_S = 0.1
+
+
 def _follow_files(
     files: list[Path],
     stems: list[str] | None,
     *,
-    keep: re.Pattern[str] | None,
-    drop: re.Pattern[str] | None,
+    keep: _LineFilter | None,
+    drop: _LineFilter | None,
 ) -> None:
     """Follow each selected file concurrently, applying the keep/drop filters.
 
@@ -154,8 +249,12 @@ def _follow_files(
         return
 
     stop_event = threading.Event()
+    wrote = threading.Event()  # set after a write, and when a follower exits
+    live_lock = threading.Lock()
+    live_followers = len(follow_files)
 
     def _follow_one(path: Path) -> None:
+        nonlocal live_followers
         try:
             for line in iter_follow_lines(path, start_at_end=True):
                 if stop_event.is_set():
@@ -163,9 +262,13 @@ def _follow_files(
                 if not _line_passes(line, keep=keep, drop=drop):
                     continue
                 sys.stdout.write(line)
-                sys.stdout.flush()
+                wrote.set()
         except OSError:
             return
+        finally:
+            with live_lock:
+                live_followers -= 1
+            wrote.set()
 
     threads = [
         threading.Thread(target=_follow_one, args=(path,), daemon=True, name=f"follow-{path.name}")
@@ -174,13 +277,23 @@ def _follow_files(
     for t in threads:
         t.start()
 
+    # Follower threads only write; flushing here, a short delay after the first
+    # write, batches a burst of lines into a few write(2) calls instead of one per
+    # line. An idle follow blocks on `wrote` with no periodic wakeups.
     try:
-        while any(t.is_alive() for t in threads):
-            for t in threads:
-                t.join(timeout=0.25)
+        while True:
+            wrote.wait()
+            time.sleep(_FOLLOW_FLUSH_DELAY_S)
+            wrote.clear()
+            sys.stdout.flush()
+            with live_lock:
+                if not live_followers:
+                    return
     except KeyboardInterrupt:
         stop_event.set()
         return
+    finally:
+        sys.stdout.flush()
 
 
 def main() -> None:
@@ -224,8 +337,8 @@ def main() -> None:
     except ValueError as e:
         raise SystemExit(str(e)) from e
 
-    pattern = re.compile(args.grep) if args.grep else None
-    exclude_pattern = re.compile(args.exclude) if args.exclude else None
+    pattern = _compile_line_filter(args.grep)
+    exclude_pattern = _compile_line_filter(args.exclude)
     stems = _parse_stems(args.logs) or None
 
     files = resolve_log_files(args.app, stems=stems)
@@ -236,9 +349,17 @@ def main() -> None:
             raise SystemExit(f"No log files matched stems {stems} in app '{args.app}'. Available: {available_str}")
         raise SystemExit(f"No log files found for app '{args.app}'")
 
-    for line in iter_recent_log_lines_merged(files, since):
-        if _line_passes(line, keep=pattern, drop=exclude_pattern):
-            sys.stdout.write(line)
+    # A TTY stdout is line-buffered (one write(2) per line); output here is
+    # flushed explicitly instead, so let it buffer in blocks.
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if callable(reconfigure):
+        reconfigure(line_buffering=False)
+
+    sys.stdout.writelines(
+        line
+        for line in iter_recent_log_lines_merged(files, since)
+        if _line_passes(line, keep=pattern, drop=exclude_pattern)
+    )
 
     if not args.follow:
         return
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
-import gzip
-import heapq
+import atexit
+import functools
+import hashlib
 import logging
 import os
+import queue
 import re
-from collections.abc import Iterable, Iterator
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from logging.handlers import WatchedFileHandler
+from logging.handlers import QueueHandler
 from pathlib import Path
 from typing import Any, Protocol, cast, runtime_checkable
 
+from instrukt_ai_logging._file_handler import BatchingQueueListener, RotationAwareFileHandler
+from instrukt_ai_logging._reading import (
+    iter_recent_log_lines as iter_recent_log_lines,
+)
+from instrukt_ai_logging._reading import (
+    iter_recent_log_lines_merged as iter_recent_log_lines_merged,
+)
+from instrukt_ai_logging._reading import (
+    parse_log_timestamp as parse_log_timestamp,
+)
+
 # Standard logging levels are: NOTSET=0, DEBUG=10, INFO=20, WARNING=30, ERROR=40, CRITICAL=50
 TRACE: int = 5
 logging.addLevelName(TRACE, "TRACE")
@@ -65,41 +81,60 @@ def _level_name_to_int(level_name: str, default: int) -> int:
     return default
 
 
-def _parse_csv(value: str) -> list[str]:
-    return [item.strip() for item in value.split(",") if item.strip()]
-
-
-def _now_utc() -> datetime:
-    return datetime.now(tz=UTC)
+@functools.lru_cache(maxsize=32)
+def _parse_csv(value: str) -> tuple[str, ...]:
+    return tuple(item.strip() for item in value.split(",") if item.strip())
 
 
 class UtcMillisFormatter(logging.Formatter):
+    # (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last record formatted. Records
+    # come in bursts within one second, so strftime runs about once per second
+    # rather than once per record. One tuple, so threads never mix second and prefix.
+    _second_prefix: tuple[int, str] = (-1, "")
+
     def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
-        dt = datetime.fromtimestamp(record.created, tz=UTC)
         if datefmt:
-            return dt.strftime(datefmt)
-        return dt.strftime("%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}Z"
+            return datetime.fromtimestamp(record.created, tz=UTC).strftime(datefmt)
+        second = int(record.created)
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second, tz=UTC).strftime("%Y-%m-%dT%H:%M:%S")
+            self._second_prefix = (second, prefix)
+        return f"{prefix}.{int(record.msecs):03d}Z"
 
 
 _SAFE_BARE_VALUE = re.compile(r"^[A-Za-z0-9._/:+-]+$")
 _SAFE_KEY = re.compile(r"^[A-Za-z_][A-Za-z0-9_.-]*$")
 
 # Keep this small and high-signal; expand only with strong justification.
-_REDACTION_PATTERNS: list[tuple[re.Pattern[str], str]] = [
+# Each entry is (group name, pattern, replacement); they are joined into one
+# alternation so a hit costs a single regex pass, not one pass per secret kind.
+_REDACTION_PATTERNS: tuple[tuple[str, str, str], ...] = (
     # Telegram bot token in API URLs: https://api.telegram.org/bot<token>/...
-    (re.compile(r"(api\\.telegram\\.org/bot)([^/\\s]+)"), r"\\1<REDACTED>"),
+    ("tg", r"api\.telegram\.org/bot[^/\s]+", "api.telegram.org/bot<REDACTED>"),
     # Generic Bearer token
-    (re.compile(r"\\bBearer\\s+[^\\s]+"), "Bearer <REDACTED>"),
+    ("bearer", r"\bBearer\s+\S+", "Bearer <REDACTED>"),
     # Common OpenAI-style key prefix (avoid leaking)
-    (re.compile(r"\\bsk-[A-Za-z0-9]{10,}\\b"), "sk-<REDACTED>"),
-]
+    ("sk", r"\bsk-[A-Za-z0-9]{10,}\b", "sk-<REDACTED>"),
+)
+
+_REDACTION_RE = re.compile("|".join(f"(?P<{group}>{pattern})" for group, pattern, _ in _REDACTION_PATTERNS))
+_REDACTION_REPLACEMENTS: dict[str, str] = {group: replacement for group, _, replacement in _REDACTION_PATTERNS}
+
+# Literal substrings every redaction match must contain. Text without any of them
+# (the overwhelmingly common case) skips the regex entirely.
+_REDACTION_PREFILTER: tuple[str, ...] = ("api.telegram.org/bot", "Bearer", "sk-")
+
+
+def _redaction_replacement(match: re.Match[str]) -> str:
+    return _REDACTION_REPLACEMENTS[cast(str, match.lastgroup)]
 
 
 def _redact_text(text: str) -> str:
-    redacted = text
-    for pattern, replacement in _REDACTION_PATTERNS:
-        redacted = pattern.sub(replacement, redacted)
-    return redacted
+    for token in _REDACTION_PREFILTER:
+        if token in text:
+            return _REDACTION_RE.sub(_redaction_replacement, text)
+    return text
 
 
 def _truncate_text(text: str, max_chars: int) -> str:
@@ -128,12 +163,38 @@ def _format_logfmt_value(value: object, *, max_chars: int) -> str:
     return f'"{_escape_quotes(text)}"'
 
 
-def _format_logfmt_string(text: str, *, max_chars: int, force_quote: bool) -> str:
-    redacted = _redact_text(text)
-    redacted = _truncate_text(redacted, max_chars=max_chars)
-    if not force_quote and _SAFE_BARE_VALUE.fullmatch(redacted):
-        return redacted
-    return f'"{_escape_quotes(redacted)}"'
+def _format_logfmt_string(redacted: str, *, max_chars: int, force_quote: bool) -> str:
+    # Callers pass already-redacted text (see `_redacted_message`).
+    text = _truncate_text(redacted, max_chars=max_chars)
+    if not force_quote and _SAFE_BARE_VALUE.fullmatch(text):
+        return text
+    return f'"{_escape_quotes(text)}"'
+
+
+# Set on a record once its message has been %-formatted, redacted and written back
+# to `record.msg`; any later handler formatting the same record reuses that text.
+_REDACTED_ATTR = "_iai_redacted"
+
+
+def _redacted_message(record: logging.LogRecord) -> str:
+    if getattr(record, _REDACTED_ATTR, False):
+        return str(record.msg)
+    msg = record.msg
+    if not record.args and isinstance(msg, str):
+        # Nothing to %-format; unless redaction rewrote it, leave the record as is.
+        redacted = _redact_text(msg)
+        if redacted is msg:
+            return msg
+    else:
+        try:
+            message = str(record.getMessage())
+        except Exception:
+            message = "<unprintable>"
+        redacted = _redact_text(message)
+    record.msg = redacted
+    record.args = ()
+    setattr(record, _REDACTED_ATTR, True)
+    return redacted
 
 
 class LogfmtFormatter(UtcMillisFormatter):
@@ -150,17 +211,15 @@ class LogfmtFormatter(UtcMillisFormatter):
         self.max_message_chars = max_message_chars
 
     def format(self, record: logging.LogRecord) -> str:
+        max_chars = self.max_message_chars
         ts = self.formatTime(record)
-        try:
-            message = record.getMessage()
-        except Exception:
-            message = "<unprintable>"
+        message = _redacted_message(record)
 
         parts = [
             ts,
-            f"level={_format_logfmt_value(record.levelname, max_chars=self.max_message_chars)}",
-            f"logger={_format_logfmt_value(record.name, max_chars=self.max_message_chars)}",
-            f"msg={_format_logfmt_string(str(message), max_chars=self.max_message_chars, force_quote=True)}",
+            f"level={_format_logfmt_value(record.levelname, max_chars=max_chars)}",
+            f"logger={_format_logfmt_value(record.name, max_chars=max_chars)}",
+            f"msg={_format_logfmt_string(message, max_chars=max_chars, force_quote=True)}",
         ]
 
         raw_kv: object = getattr(record, "kv", None)
@@ -173,14 +232,14 @@ class LogfmtFormatter(UtcMillisFormatter):
                     continue
                 if not _SAFE_KEY.fullmatch(key):
                     continue
-                parts.append(f"{key}={_format_logfmt_value(kv[key], max_chars=self.max_message_chars)}")
+                parts.append(f"{key}={_format_logfmt_value(kv[key], max_chars=max_chars)}")
 
         if record.exc_info:
             try:
                 exc_text = self.formatException(record.exc_info).replace("\n", "\\n")
             except Exception:
                 exc_text = "<exception>"
-            parts.append(f"exc={_format_logfmt_value(exc_text, max_chars=self.max_message_chars)}")
+            parts.append(f"exc={_format_logfmt_value(exc_text, max_chars=max_chars)}")
 
         return " ".join(parts)
 
@@ -311,14 +370,187 @@ class _ThirdPartySelectorFilter(logging.Filter):
         super().__init__()
         self.app_logger_prefix = app_logger_prefix
         self.spotlight_prefixes = spotlight_prefixes
+        # Dotted forms are built once; `str.startswith` takes a tuple and loops in C.
+        self._app_dotted = app_logger_prefix + "."
+        self._spotlight_exact = frozenset(spotlight_prefixes)
+        self._spotlight_dotted = tuple(p + "." for p in spotlight_prefixes)
 
     def filter(self, record: logging.LogRecord) -> bool:
         name = record.name
-        if name == self.app_logger_prefix or name.startswith(self.app_logger_prefix + "."):
+        if name == self.app_logger_prefix or name.startswith(self._app_dotted):
             return True
-        if not self.spotlight_prefixes:
+        if not self._spotlight_dotted:
             return True
-        return any(name == p or name.startswith(p + ".") for p in self.spotlight_prefixes)
+        return name in self._spotlight_exact or name.startswith(self._spotlight_dotted)
+
+
+def _render_for_key(render: Callable[[object], str], value: object) -> str:
+    # A value whose __repr__/__str__ raises must not turn dedup into a new way for
+    # a log call to raise: filters run before `Handler.emit`'s error guard.
+    try:
+        return render(value)
+    except Exception:
+        return f"<{type(value).__qualname__}>"
+
+
+def _dedup_key(record: logging.LogRecord) -> bytes:
+    # A fixed-size digest, so the cache holds 1024 short keys rather than up to
+    # 1024 copies of large messages and kv payloads.
+    parts = [str(record.levelno), record.name, _redacted_message(record)]
+    raw_kv: object = getattr(record, "kv", None)
+    if isinstance(raw_kv, dict) and raw_kv:
+        kv = cast("dict[object, object]", raw_kv)
+        parts.extend(
+            f"{k}={v}" for k, v in sorted((_render_for_key(str, k), _render_for_key(repr, v)) for k, v in kv.items())
+        )
+    if record.exc_info and record.exc_info[0] is not None:
+        exc_type, exc_value, _ = record.exc_info
+        parts.extend(("exc", exc_type.__qualname__, _render_for_key(str, exc_value)))
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        encoded = part.encode("utf-8", "surrogatepass")
+        digest.update(len(encoded).to_bytes(8, "little"))
+        digest.update(encoded)
+    return digest.digest()
+
+
+class _DedupFilter(logging.Filter):
+    """Drop a record identical to one emitted less than `window_s` seconds ago.
+
+    Identity is level, logger, rendered message, the `**kv` fields and the
+    exception type/text: the message is usually a constant event name with the
+    varying data in kv, so `job_done job_id=1` and `job_done job_id=2` are
+    distinct. The message is rendered via `_redacted_message`, which caches it on
+    the record, so a record that passes costs the formatter nothing extra. At most
+    `cache` distinct keys (16-byte digests) are kept; the least recently emitted
+    is evicted first.
+    """
+
+    def __init__(self, window_s: float, cache: int = 1024) -> None:
+        super().__init__()
+        self.window_s = window_s
+        self.cache = cache
+        self._last_emitted: OrderedDict[bytes, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = _dedup_key(record)
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_emitted.get(key)
+            if last is not None and now - last < self.window_s:
+                return False
+            self._last_emitted[key] = now
+            self._last_emitted.move_to_end(key)
+            if len(self._last_emitted) > self.cache:
+                self._last_emitted.popitem(last=False)
+        return True
+
+
+_KV_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Hand records to the background writer without flattening them.
+
+    The stock `prepare` formats with this handler's own formatter and drops
+    `exc_info` so records survive pickling. This queue never leaves the process,
+    so the record keeps its exception info and is only frozen: the message is
+    %-formatted (and redacted) and non-scalar kv values are rendered now, while
+    they still hold their call-site values. The file handler's `LogfmtFormatter`
+    does the rest on the writer thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        _redacted_message(record)
+        raw_kv: object = getattr(record, "kv", None)
+        if isinstance(raw_kv, dict):
+            kv = cast("dict[object, object]", raw_kv)
+            record.kv = {k: v if isinstance(v, _KV_SCALAR_TYPES) else str(v) for k, v in kv.items()}
+        return record
+
+
+# Whether `configure_logging(use_global_disable=True)` has called `logging.disable`.
+_global_disable_applied = False
+
+# Listener owning the file handler, and the root handler feeding it, when
+# `configure_logging(background_writer=True)`.
+_background_listener: BatchingQueueListener | None = None
+_background_queue_handler: _RecordQueueHandler | None = None
+
+
+def _stop_background_writer() -> None:
+    """Hand root back the background writer's file handler and stop the writer thread.
+
+    Runs at exit, before `logging.shutdown`, so records logged by later exit hooks
+    are written synchronously instead of queued for a thread that is gone.
+    """
+    global _background_listener, _background_queue_handler
+    listener, queue_handler = _background_listener, _background_queue_handler
+    if listener is None or queue_handler is None:
+        return
+    _background_listener = None
+    _background_queue_handler = None
+    file_handler = listener.file_handler
+    file_handler.filters = list(queue_handler.filters)
+    logging.root.handlers = [file_handler if h is queue_handler else h for h in logging.root.handlers]
+    listener.stop()
+    file_handler.stop_deferring()
+
+
+atexit.register(_stop_background_writer)
+
+
+# File handler held across a fork: taken before, so the child's copy of its buffer
+# is empty and not mid-write, and released again in the parent.
+_fork_held_handler: RotationAwareFileHandler | None = None
+
+
+def _hold_background_writer_for_fork() -> None:
+    global _fork_held_handler
+    listener = _background_listener
+    if listener is None:
+        return
+    handler = listener.file_handler
+    handler.acquire()
+    _fork_held_handler = handler
+    try:
+        handler.flush_batch()
+    except Exception:
+        pass  # the listener's next batch flush retries (and reports) it
+
+
+def _release_background_writer_after_fork() -> None:
+    global _fork_held_handler
+    if _fork_held_handler is not None:
+        _fork_held_handler.release()
+        _fork_held_handler = None
+
+
+def _restart_background_writer_in_child() -> None:
+    """Give a forked child its own writer thread; otherwise its records are only queued.
+
+    The parent's queue may still hold the parent's records, which its own listener
+    writes, so the child starts from a fresh queue. The handler lock taken before
+    the fork is reinitialised by `logging`'s own at-fork hook, which runs first.
+    """
+    global _background_listener, _fork_held_handler
+    _fork_held_handler = None
+    listener, queue_handler = _background_listener, _background_queue_handler
+    if listener is None or queue_handler is None:
+        return
+    record_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler.queue = record_queue
+    _background_listener = BatchingQueueListener(record_queue, listener.file_handler)
+    _background_listener.start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_hold_background_writer_for_fork,
+        after_in_parent=_release_background_writer_after_fork,
+        after_in_child=_restart_background_writer_in_child,
+    )
 
 
 @dataclass(frozen=True)
@@ -345,8 +577,14 @@ class LoggingContract:
 
 
 def _resolve_log_root(app_name: str) -> Path:
+    # The env is read on every call so a changed XDG_STATE_HOME/HOME takes effect;
+    # only the path building for a given combination is cached.
+    return _log_root_for(app_name, os.getenv("XDG_STATE_HOME"), os.getenv("HOME"))
+
+
+@functools.lru_cache(maxsize=32)
+def _log_root_for(app_name: str, xdg_state_home: str | None, home: str | None) -> Path:
     fs_app_name = _normalize_app_name(app_name)
-    xdg_state_home = os.getenv("XDG_STATE_HOME")
     state_home = Path(xdg_state_home).expanduser() if xdg_state_home else Path("~/.local/state").expanduser()
     return state_home / "instrukt-ai" / fs_app_name
 
@@ -413,6 +651,9 @@ def configure_logging(
     *,
     source: str | None = None,
     max_message_chars: int = 4000,
+    background_writer: bool = False,
+    dedup_window_s: float = 0.0,
+    use_global_disable: bool = False,
 ) -> Path:
     """Configure logging according to the InstruktAI contract.
 
@@ -421,6 +662,22 @@ def configure_logging(
     (e.g. `source="cron"`), the file is `<source>.log`. The `.log` extension
     is always appended by the library; callers pass the bare stem.
 
+    `background_writer=True` moves formatting and file I/O off the calling
+    thread: the root handler becomes a `QueueHandler` and a `QueueListener`
+    thread owns the file handler, drained at interpreter exit and restarted in a
+    forked child. Records still in the queue are lost if the process dies
+    abruptly, so the default stays synchronous.
+
+    `dedup_window_s > 0` drops a record whose level, logger, message, kv fields
+    and exception repeat one written less than that many seconds ago (e.g. a
+    stalled client retrying in a tight loop). Off by default: every record is
+    written.
+
+    `use_global_disable=True` also calls `logging.disable()` just below the
+    lowest level this configuration lets through, so calls under it return
+    before a `LogRecord` is built. That is process-global: it overrides levels
+    any other code sets on its own loggers, which is why it is opt-in.
+
     Returns the resolved log file path in use.
     """
     env_prefix = _normalize_env_prefix(name)
@@ -455,19 +712,51 @@ def configure_logging(
     log_file = log_dir / log_filename
 
     formatter = LogfmtFormatter(max_message_chars=max_message_chars)
-    selector = _ThirdPartySelectorFilter(app_logger_prefix=app_logger_prefix, spotlight_prefixes=tuple(spotlight))
+    selector = _ThirdPartySelectorFilter(app_logger_prefix=app_logger_prefix, spotlight_prefixes=spotlight)
 
     # Logging is an essential subsystem: an unwritable log dir/file raises here
     # and the host process must not start blind. No degraded/fallback mode.
     _ensure_log_dir(log_dir)
-    handler: logging.Handler = WatchedFileHandler(log_file, encoding="utf-8")
-
-    handler.setLevel(logging.NOTSET)
-    handler.setFormatter(formatter)
+    file_handler = RotationAwareFileHandler(log_file, encoding="utf-8", defer_flush=background_writer)
+    file_handler.setLevel(logging.NOTSET)
+    file_handler.setFormatter(formatter)
+
+    handler: logging.Handler = file_handler
+    listener: BatchingQueueListener | None = None
+    queue_handler: _RecordQueueHandler | None = None
+    if background_writer:
+        record_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        handler = queue_handler = _RecordQueueHandler(record_queue)
+        handler.setLevel(logging.NOTSET)
+        listener = BatchingQueueListener(record_queue, file_handler)
+
+    # Handler filters run before the formatter (and, with a background writer,
+    # before enqueueing), so a record the selector rejects never pays for
+    # %-formatting, redaction or a queue hop. Keep cheap rejecting checks here and
+    # the expensive per-record work in the formatter.
     handler.addFilter(selector)
-
-    # Configure root.
+    if dedup_window_s > 0:
+        handler.addFilter(_DedupFilter(dedup_window_s))
+
+    # Configure root. Everything that can fail is done by now, so a failed call
+    # leaves the previous configuration writing. Swap the handlers before stopping
+    # an earlier background writer, so nothing is queued for a stopped thread, then
+    # close an earlier file handler so its file and inotify watch are released now,
+    # not whenever the GC gets to them.
+    global _background_listener, _background_queue_handler
+    previous_listener = _background_listener
+    if listener is not None:
+        listener.start()
+    _background_listener, _background_queue_handler = listener, queue_handler
+    previous_handlers = logging.root.handlers
     logging.root.handlers = [handler]
+    if previous_listener is not None:
+        previous_listener.stop()
+    for previous in previous_handlers:
+        if isinstance(previous, RotationAwareFileHandler):
+            previous.close()
+    if previous_listener is not None:
+        previous_listener.file_handler.close()
     logging.root.setLevel(root_level)
 
     # Configure our logs.
@@ -483,6 +772,21 @@ def configure_logging(
     for prefix in muted:
         logging.getLogger(prefix).setLevel(logging.WARNING)
 
+    global _global_disable_applied
+    if use_global_disable:
+        levels = [our_level, root_level]
+        if spotlight:
+            levels.append(third_party_level)
+        if muted:
+            levels.append(logging.WARNING)
+        floor = min(levels)
+        logging.disable(floor - 1 if floor > logging.NOTSET else logging.NOTSET)
+        _global_disable_applied = True
+    elif _global_disable_applied:
+        # Undo only what an earlier call of ours set, never a host's own disable().
+        logging.disable(logging.NOTSET)
+        _global_disable_applied = False
+
     return log_file
 
 
@@ -505,143 +809,3 @@ def parse_since(value: str) -> timedelta:
     if unit == "d":
         return timedelta(days=n)
     raise ValueError(f"Invalid duration unit: {unit}")
-
-
-def parse_log_timestamp(line: str) -> datetime | None:
-    """Parse the timestamp at the start of a standard log line.
-
-    Expected: YYYY-MM-DDTHH:MM:SS.mmmZ ...
-    """
-    token = line.split(" ", 1)[0].strip()
-    if not token.endswith("Z"):
-        return None
-    try:
-        # Python doesn't accept 'Z' directly in fromisoformat.
-        return datetime.fromisoformat(token.replace("Z", "+00:00"))
-    except ValueError:
-        return None
-
-
-def iter_recent_log_lines(log_file: Path, since: timedelta) -> list[str]:
-    """Return log lines newer than now-`since`, reading rotated siblings when present."""
-    cutoff = _now_utc() - since
-
-    candidates = sorted(
-        [p for p in log_file.parent.glob(log_file.name + "*") if p.is_file() and not p.name.endswith(".gz")],
-        key=lambda p: p.stat().st_mtime,
-    )
-
-    lines: list[str] = []
-    for path in candidates:
-        try:
-            with path.open("r", encoding="utf-8", errors="replace") as f:
-                for line in f:
-                    ts = parse_log_timestamp(line)
-                    if ts is None:
-                        continue
-                    if ts >= cutoff:
-                        lines.append(line)
-        except FileNotFoundError:
-            continue
-
-    return lines
-
-
-# Initial backward-probe size for locating the start of the --since window in a
-# large file. A typical multi-minute window fits in one or two probes; the probe
-# doubles when the window is larger, so worst case is still O(window), not O(file).
-_WINDOW_PROBE_BYTES = 262144  # 256 KiB
-
-
-def _window_start_offset(path: Path, cutoff: datetime) -> int:
-    """Return a byte offset at or before the first line newer than `cutoff`.
-
-    A log file is appended in timestamp order, so the window's start can be found
-    by probing backward from EOF in exponentially growing chunks instead of
-    scanning from byte 0: once a probe's earliest timestamped line is already
-    older than the cutoff, the window begins within that probe and everything
-    before it is skippable. Returns 0 when the window spans the whole file (or the
-    file is smaller than a single probe), which reproduces a full forward scan.
-    """
-    try:
-        size = path.stat().st_size
-    except OSError:
-        return 0
-    if size <= _WINDOW_PROBE_BYTES:
-        return 0
-
-    probe = _WINDOW_PROBE_BYTES
-    with path.open("rb") as fb:
-        while probe < size:
-            start = size - probe
-            fb.seek(start)
-            fb.readline()  # discard the partial line spanning the probe boundary
-            first_ts: datetime | None = None
-            for raw in fb:
-                first_ts = parse_log_timestamp(raw.decode("utf-8", errors="replace"))
-                if first_ts is not None:
-                    break
-            if first_ts is not None and first_ts < cutoff:
-                return start
-            probe *= 2
-    return 0
-
-
-def iter_recent_log_lines_merged(files: Iterable[Path], since: timedelta) -> Iterator[str]:
-    """Yield lines newer than now-`since` merged across multiple files by timestamp.
-
-    Each file is read independently; lines without a parsable leading timestamp
-    inherit the previous parsed timestamp from their own file (so multi-line
-    entries stay adjacent to their parent). The resulting per-file streams are
-    merged via a k-way heap merge, producing a single chronologically-ordered
-    output stream.
-
-    Files whose mtime falls before the cutoff are skipped entirely — no line
-    inside them can be newer than the file itself, so reading them only burns
-    I/O. This matters for log directories with large rotation history or
-    sibling streams (git-wrapper.log, etc.) the caller didn't explicitly
-    request via `--logs`.
-    """
-    cutoff = _now_utc() - since
-
-    def _file_stream(path: Path) -> Iterator[tuple[datetime, str]]:
-        is_gzip = path.name.endswith(".gz")
-        try:
-            fb = gzip.open(path, "rb") if is_gzip else path.open("rb")
-        except FileNotFoundError:
-            return
-        try:
-            # Gzip streams cannot use the raw byte probe; stream eligible archives from member start.
-            offset = 0 if is_gzip else _window_start_offset(path, cutoff)
-            if offset:
-                fb.seek(offset)
-                fb.readline()  # discard the partial line at the seek boundary
-            last_ts: datetime | None = None
-            for raw in fb:
-                line = raw.decode("utf-8", errors="replace")
-                ts = parse_log_timestamp(line)
-                if ts is None:
-                    if last_ts is None or last_ts < cutoff:
-                        continue
-                    yield (last_ts, line)
-                    continue
-                last_ts = ts
-                if ts < cutoff:
-                    continue
-                yield (ts, line)
-        finally:
-            fb.close()
-
-    eligible: list[Path] = []
-    for path in files:
-        try:
-            mtime = datetime.fromtimestamp(path.stat().st_mtime, tz=UTC)
-        except OSError:
-            continue
-        if mtime < cutoff:
-            continue
-        eligible.append(path)
-
-    streams = [_file_stream(p) for p in eligible]
-    for _, line in heapq.merge(*streams, key=lambda item: item[0]):
-        yield line
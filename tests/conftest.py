@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import os
 import threading
 from pathlib import Path
@@ -35,6 +36,28 @@ def pytest_sessionfinish() -> None:
         _session_timeout_timer.cancel()
 
 
+def read_log_text(path: Path) -> str:
+    return path.read_text(encoding="utf-8", errors="replace")
+
+
+@pytest.fixture()
+def isolated_logging():
+    """Restore the root logger's handlers and level after a `configure_logging` test."""
+    previous_handlers = list(logging.root.handlers)
+    previous_root_level = logging.root.level
+
+    try:
+        yield
+    finally:
+        for handler in logging.root.handlers:
+            try:
+                handler.close()
+            except Exception:
+                pass
+        logging.root.handlers = previous_handlers
+        logging.root.setLevel(previous_root_level)
+
+
 class _FakeCompletedProcess:
     def __init__(self) -> None:
         self.returncode = 0
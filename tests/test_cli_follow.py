@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import io
+import sys
 import threading
 import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pytest
+from instrukt_ai_logging import cli
 from instrukt_ai_logging.cli import iter_follow_lines
 
+_FOLLOWED_LINES = ("first\n", "second\n")
+# Several old 100 ms flush ticks' worth of idle time between the burst and exit.
+_IDLE_S = 0.5
+# One flush for the burst, one when the follower exits, one on the way out.
+_MAX_FLUSHES = 3
+
 
 def _append(path: Path, text: str) -> None:
     with path.open("a", encoding="utf-8") as f:
@@ -44,3 +54,102 @@ def test_iter_follow_lines_yields_appended_lines_only():
 
         t.join(timeout=3)
         assert got == ["new1\n", "new2\n"]
+
+
+def _follow_in_thread(
+    log_file: Path, got: list[str], *, max_lines: int, poll_interval_s: float = 0.01
+) -> threading.Thread:
+    def _reader():
+        got.extend(
+            iter_follow_lines(
+                log_file,
+                poll_interval_s=poll_interval_s,
+                start_at_end=True,
+                max_lines=max_lines,
+                max_seconds=2,
+            )
+        )
+
+    t = threading.Thread(target=_reader, daemon=True)
+    t.start()
+    # Give the reader time to open+seek to end.
+    time.sleep(0.05)
+    return t
+
+
+def test_iter_follow_lines_holds_partial_line_until_newline():
+    with TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / "app.log"
+        log_file.write_text("", encoding="utf-8")
+
+        got: list[str] = []
+        t = _follow_in_thread(log_file, got, max_lines=1)
+
+        _append(log_file, "par")
+        time.sleep(0.05)
+        _append(log_file, "tial\n")
+
+        t.join(timeout=3)
+        assert got == ["partial\n"]
+
+
+def test_iter_follow_lines_continues_into_rotated_replacement():
+    with TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / "app.log"
+        log_file.write_text("", encoding="utf-8")
+
+        got: list[str] = []
+        t = _follow_in_thread(log_file, got, max_lines=2)
+
+        _append(log_file, "before\n")
+        time.sleep(0.05)
+        log_file.rename(log_file.with_name("app.log.1"))
+        _append(log_file, "after\n")
+
+        t.join(timeout=3)
+        assert got == ["before\n", "after\n"]
+
+
+@pytest.mark.skipif(sys.platform not in ("linux", "darwin"), reason="needs inotify or kqueue")
+def test_iter_follow_lines_wakes_on_append_before_poll_interval():
+    with TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / "app.log"
+        log_file.write_text("", encoding="utf-8")
+
+        got: list[str] = []
+        # A poll interval far beyond the assertion budget: only a kernel wakeup
+        # can deliver the line in time.
+        t = _follow_in_thread(log_file, got, max_lines=1, poll_interval_s=1.5)
+        time.sleep(0.1)  # let the reader reach its first wait
+
+        started = time.monotonic()
+        _append(log_file, "wake\n")
+        t.join(timeout=3)
+
+        assert got == ["wake\n"]
+        assert time.monotonic() - started < 0.5
+
+
+class _FlushCountingStdout(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+
+def test_follow_files_flushes_after_writes_not_on_a_timer(monkeypatch: pytest.MonkeyPatch):
+    def _fake_follow_lines(path: Path, **_: object):
+        yield from _FOLLOWED_LINES
+        time.sleep(_IDLE_S)
+
+    stdout = _FlushCountingStdout()
+    monkeypatch.setattr(cli, "iter_follow_lines", _fake_follow_lines)
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    cli._follow_files([Path("app.log")], None, keep=None, drop=None)
+
+    assert stdout.getvalue() == "".join(_FOLLOWED_LINES)
+    assert stdout.flushes <= _MAX_FLUSHES
@@ -1,11 +1,17 @@
+import io
 import logging
 import os
-from logging.handlers import WatchedFileHandler
+import time
+from logging.handlers import QueueHandler, WatchedFileHandler
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import pytest
 from instrukt_ai_logging import InstruktAILogger, configure_logging, get_logger
+from instrukt_ai_logging import logging as iai_logging
+from instrukt_ai_logging._file_handler import RotationAwareFileHandler
+
+from tests.conftest import read_log_text
 
 # Log markers shared by each test and its assertions — named constants per
 # software-development/procedure/snapshot-testing (no bare literals in content
@@ -15,6 +21,11 @@ _LOGGER_OURS = "teleclaude.core"
 _LOGGER_HTTPCORE = "httpcore.http11"
 _LOGGER_TELEGRAM = "telegram.ext.ExtBot"
 _LOGGER_MUTED = "teleclaude.cli.tui"
+_LOGGER_HTTPCORE_LOOKALIKE = "httpcore-x"
+_LOGGER_TELEGRAM_PARENT = "telegram"
+_LOGGER_APP_LOOKALIKE = "teleclaudex"
+_SPOTLIGHT_HTTPCORE = "httpcore"
+_SPOTLIGHT_TELEGRAM_EXT = "telegram.ext"
 
 _MSG_OURS = "hello from ours"
 _MSG_THIRD_PARTY = "hello from third-party"
@@ -24,6 +35,15 @@ _MSG_HELLO = "hello"
 _MSG_CORE_DEBUG = "core debug"
 _MSG_TUI_DEBUG = "tui debug"
 _MSG_TUI_WARNING = "tui warning"
+_MSG_BOOM = "boom in background"
+_MSG_JOB_DONE = "job_done"
+_MSG_AFTER_FLUSH_ERROR = "after flush error"
+_MSG_AFTER_FAILED_RECONFIGURE = "after failed reconfigure"
+_MSG_FORK_PARENT = "parent before fork"
+_MSG_FORK_CHILD = "from forked child"
+_FIELD_MSG_FORK_PARENT = f'msg="{_MSG_FORK_PARENT}"'
+_MSG_JOB_FAILED = "job_failed"
+_JOB_IDS = (1, 2, 3)
 
 _KV_SESSION = "abc123"
 _KV_N = 1
@@ -41,27 +61,10 @@ _FIELD_SESSION = f"session={_KV_SESSION}"
 _FIELD_N = f"n={_KV_N}"
 
 _APP_NAME = "teleclaude"
-
-
-@pytest.fixture()
-def isolated_logging():
-    previous_handlers = list(logging.root.handlers)
-    previous_root_level = logging.root.level
-
-    try:
-        yield
-    finally:
-        for handler in logging.root.handlers:
-            try:
-                handler.close()
-            except Exception:
-                pass
-        logging.root.handlers = previous_handlers
-        logging.root.setLevel(previous_root_level)
-
-
-def _read_text(path: Path) -> str:
-    return path.read_text(encoding="utf-8", errors="replace")
+_MAX_MESSAGE_CHARS = 4000
+_BURST_RECORDS = 200
+_FLUSH_TIMEOUT_S = 2.0
+_DEDUP_KEY_BYTES = 16
 
 
 def test_our_logs_respect_app_level_and_third_party_baseline(isolated_logging, monkeypatch):
@@ -76,7 +79,7 @@ def test_our_logs_respect_app_level_and_third_party_baseline(isolated_logging, m
         logging.getLogger(_LOGGER_OURS).debug(_MSG_OURS)
         logging.getLogger(_LOGGER_HTTPCORE).info(_MSG_THIRD_PARTY)
 
-        content = _read_text(log_path)
+        content = read_log_text(log_path)
         assert _FIELD_LOGGER_OURS in content
         assert _FIELD_MSG_OURS in content
         assert _FIELD_LOGGER_HTTPCORE not in content
@@ -172,7 +175,7 @@ def test_spotlight_allows_selected_third_party_only(isolated_logging, monkeypatc
             httpcore_logger.setLevel(previous_httpcore_level)
             telegram_logger.setLevel(previous_telegram_level)
 
-        content = _read_text(log_path)
+        content = read_log_text(log_path)
         assert _FIELD_LOGGER_HTTPCORE in content
         assert _FIELD_MSG_HTTPCORE in content
         assert _FIELD_LOGGER_TELEGRAM not in content
@@ -189,7 +192,7 @@ def test_named_kv_logger_emits_pairs(isolated_logging, monkeypatch):
 
         logging.getLogger(_LOGGER_OURS).info(_MSG_HELLO, session=_KV_SESSION, n=_KV_N)
 
-        content = _read_text(log_path)
+        content = read_log_text(log_path)
         assert _FIELD_MSG_HELLO in content
         assert _FIELD_SESSION in content
         assert _FIELD_N in content
@@ -208,7 +211,7 @@ def test_muted_loggers_forced_to_warning(isolated_logging, monkeypatch):
         logging.getLogger(_LOGGER_MUTED).debug(_MSG_TUI_DEBUG)
         logging.getLogger(_LOGGER_MUTED).warning(_MSG_TUI_WARNING)
 
-        content = _read_text(log_path)
+        content = read_log_text(log_path)
         # Core debug should appear (app level is DEBUG)
         assert _FIELD_LOGGER_OURS in content
         assert _FIELD_MSG_CORE_DEBUG in content
@@ -217,3 +220,375 @@ def test_muted_loggers_forced_to_warning(isolated_logging, monkeypatch):
         # Muted logger's warning SHOULD appear
         assert _FIELD_LOGGER_MUTED in content
         assert _FIELD_MSG_TUI_WARNING in content
+
+
+def test_selector_rejects_before_formatter_redaction_runs(isolated_logging, monkeypatch):
+    with TemporaryDirectory() as tmp:
+        monkeypatch.setenv("XDG_STATE_HOME", tmp)
+        monkeypatch.setenv("TELECLAUDE_LOG_LEVEL", "INFO")
+        monkeypatch.setenv("TELECLAUDE_THIRD_PARTY_LOG_LEVEL", "INFO")
+        monkeypatch.setenv("TELECLAUDE_THIRD_PARTY_LOGGERS", "httpcore")
+
+        configure_logging("teleclaude")
+
+        redacted: list[str] = []
+        real_redacted_message = iai_logging._redacted_message
+
+        def _spy(record: logging.LogRecord) -> str:
+            redacted.append(record.name)
+            return real_redacted_message(record)
+
+        monkeypatch.setattr(iai_logging, "_redacted_message", _spy)
+
+        telegram_logger = logging.getLogger("telegram")
+        previous_telegram_level = telegram_logger.level
+        telegram_logger.setLevel(logging.INFO)
+        try:
+            logging.getLogger(_LOGGER_TELEGRAM).info(_MSG_TELEGRAM)
+            logging.getLogger(_LOGGER_OURS).info(_MSG_OURS)
+        finally:
+            telegram_logger.setLevel(previous_telegram_level)
+
+        assert redacted == [_LOGGER_OURS]
+
+
+def test_background_writer_moves_file_io_to_listener_thread(isolated_logging, monkeypatch):
+    with TemporaryDirectory() as tmp:
+        monkeypatch.setenv("XDG_STATE_HOME", tmp)
+        monkeypatch.setenv("TELECLAUDE_LOG_LEVEL", "INFO")
+        monkeypatch.delenv("TELECLAUDE_THIRD_PARTY_LOGGERS", raising=False)
+
+        log_path = configure_logging(_APP_NAME, background_writer=True)
+        try:
+            assert len(logging.root.handlers) == 1
+            assert isinstance(logging.root.handlers[0], QueueHandler)
+
+            logger = logging.getLogger(_LOGGER_OURS)
+            logger.info("%s", _MSG_OURS, extra={"kv": {"session": _KV_SESSION}})
+            try:
+                raise ValueError(_MSG_BOOM)
+            except ValueError:
+                logger.exception(_MSG_HELLO)
+        finally:
+            # Stopping drains the queue, so everything logged above is on disk.
+            iai_logging._stop_background_writer()
+
+        content = read_log_text(log_path)
+        assert _FIELD_MSG_OURS in content
+        assert _FIELD_SESSION in content
+        assert _FIELD_MSG_HELLO in content
+        assert _MSG_BOOM in content
+
+
+def test_dedup_window_drops_repeats_but_keeps_distinct_messages(isolated_logging, monkeypatch):
+    with TemporaryDirectory() as tmp:
+        monkeypatch.setenv("XDG_STATE_HOME", tmp)
+        monkeypatch.setenv("TELECLAUDE_LOG_LEVEL", "INFO")
+        monkeypatch.delenv("TELECLAUDE_THIRD_PARTY_LOGGERS", raising=False)
+
+        log_path = configure_logging(_APP_NAME, dedup_window_s=60.0)
+
+        logger = logging.getLogger(_LOGGER_OURS)
+        for _ in range(3):
+            logger.info(_MSG_OURS)
+        logger.info(_MSG_HELLO)
+        logger.warning(_MSG_OURS)
+
+        content = read_log_text(log_path)
+        assert content.count(_FIELD_MSG_OURS) == 2
+        assert content.count(_FIELD_MSG_HELLO) == 1
+
+
+def test_dedup_window_keeps_records_that_differ_only_in_kv(isolated_logging, monkeypatch):
+    with TemporaryDirectory() as tmp:
+        monkeypatch.setenv("XDG_STATE_HOME", tmp)
+        monkeypatch.setenv("TELECLAUDE_LOG_LEVEL", "INFO")
+        monkeypatch.delenv("TELECLAUDE_THIRD_PARTY_LOGGERS", raising=False)
+
+        log_path = configure_logging(_APP_NAME, dedup_window_s=60.0)
+
+        logger = get_logger(_LOGGER_OURS)
+        for job_id in _JOB_IDS:
+            logger.info(_MSG_JOB_DONE, job_id=job_id)
+        logger.info(_MSG_JOB_DONE, job_id=_JOB_IDS[0])
+
+        content = read_log_text(log_path)
+        assert content.count(_MSG_JOB_DONE) == len(_JOB_IDS)
+        for job_id in _JOB_IDS:
+            assert f"job_id={job_id}" in content
+
+
+def test_dedup_window_keeps_records_that_differ_only_in_exception(isolated_logging, monkeypatch):
+    with TemporaryDirectory() as tmp:
+        monkeypatch.setenv("XDG_STATE_HOME", tmp)
+        monkeypatch.setenv("TELECLAUDE_LOG_LEVEL", "INFO")
+        monkeypatch.delenv("TELECLAUDE_THIRD_PARTY_LOGGERS", raising=False)
+
+        log_path = configure_logging(_APP_NAME, dedup_window_s=60.0)
+
+        logger = logging.getLogger(_LOGGER_OURS)
+        for exc in (ValueError(_MSG_BOOM), KeyError(_MSG_BOOM), ValueError(_MSG_HELLO)):
+            try:
+                raise exc
+            except Exception:
+                logger.exception(_MSG_JOB_FAILED)
+
+        content = read_log_text(log_path)
+        assert content.count(_MSG_JOB_FAILED) == 3
+        assert KeyError.__name__ in content
+
+
+class _UnrenderableValue:
+    def __repr__(self) -> str:
+        raise RuntimeError(_MSG_BOOM)
+
+    __str__ = __repr__
+
+
+def test_dedup_filter_passes_record_whose_kv_value_cannot_be_rendered():
+    dedup = iai_logging._DedupFilter(window_s=60.0)
+    record = logging.LogRecord(_LOGGER_OURS, logging.INFO, __file__, 1, _MSG_JOB_DONE, None, None)
+    record.kv = {"payload": _UnrenderableValue()}
+
+    assert dedup.filter(record)
+
+
+def test_dedup_key_size_does_not_grow_with_payload():
+    record = logging.LogRecord(_LOGGER_OURS, logging.INFO, __file__, 1, _MSG_OURS * _BURST_RECORDS, None, None)
+    record.kv = {"payload": _MSG_HELLO * _BURST_RECORDS}
+
+    assert len(iai_logging._dedup_key(record)) == _DEDUP_KEY_BYTES
+
+
+def test_dedup_filter_evicts_oldest_key_beyond_cache_size():
+    dedup = iai_logging._DedupFilter(window_s=60.0, cache=1)
+
+    def _make(msg: str) -> logging.LogRecord:
+        return logging.LogRecord(_LOGGER_OURS, logging.INFO, __file__, 1, msg, None, None)
+
+    assert dedup.filter(_make(_MSG_OURS))
+    assert not dedup.filter(_make(_MSG_OURS))
+    assert dedup.filter(_make(_MSG_HELLO))
+    # _MSG_OURS was evicted to make room, so it is emitted again.
+    assert dedup.filter(_make(_MSG_OURS))
+
+
+def test_extra_console_handler_reuses_redaction_from_file_handler(isolated_logging, monkeypatch):
+    with TemporaryDirectory() as tmp:
+        monkeypatch.setenv("XDG_STATE_HOME", tmp)
+        monkeypatch.setenv("TELECLAUDE_LOG_LEVEL", "INFO")
+        monkeypatch.delenv("TELECLAUDE_THIRD_PARTY_LOGGERS", raising=False)
+
+        configure_logging(_APP_NAME)
+        console = logging.StreamHandler(io.StringIO())
+        console.setFormatter(iai_logging.LogfmtFormatter(max_message_chars=_MAX_MESSAGE_CHARS))
+        logging.root.addHandler(console)
+
+        redactions: list[str] = []
+        real_redact_text = iai_logging._redact_text
+
+        def _spy(text: str) -> str:
+            redactions.append(text)
+            return real_redact_text(text)
+
+        monkeypatch.setattr(iai_logging, "_redact_text", _spy)
+
+        logging.getLogger(_LOGGER_OURS).info("%s", _MSG_OURS)
+
+        # level/logger fields are scrubbed per formatter; the message only once.
+        assert redactions.count(_MSG_OURS) == 1
+        assert _FIELD_MSG_OURS in console.stream.getvalue()
+
+
+def test_resolve_log_file_follows_xdg_state_home_changes(monkeypatch):
+    with TemporaryDirectory() as first, TemporaryDirectory() as second:
+        monkeypatch.setenv("XDG_STATE_HOME", first)
+        first_path = iai_logging.resolve_log_file(_APP_NAME)
+        monkeypatch.setenv("XDG_STATE_HOME", second)
+        second_path = iai_logging.resolve_log_file(_APP_NAME)
+
+        assert first_path.is_relative_to(first)
+        assert second_path.is_relative_to(second)
+
+
+def test_selector_matches_spotlight_on_dotted_boundaries_only():
+    selector = iai_logging._ThirdPartySelectorFilter(
+        app_logger_prefix=_APP_NAME, spotlight_prefixes=(_SPOTLIGHT_HTTPCORE, _SPOTLIGHT_TELEGRAM_EXT)
+    )
+
+    def _passes(name: str) -> bool:
+        return selector.filter(logging.LogRecord(name, logging.INFO, __file__, 1, _MSG_HELLO, None, None))
+
+    assert _passes(_APP_NAME)
+    assert _passes(_LOGGER_OURS)
+    assert _passes(_SPOTLIGHT_HTTPCORE)
+    assert _passes(_LOGGER_HTTPCORE)
+    assert _passes(_LOGGER_TELEGRAM)
+    assert not _passes(_LOGGER_HTTPCORE_LOOKALIKE)
+    assert not _passes(_LOGGER_TELEGRAM_PARENT)
+    assert not _passes(_LOGGER_APP_LOOKALIKE)
+
+
+def test_background_writer_flushes_burst_once_queue_drains(isolated_logging, monkeypatch):
+    with TemporaryDirectory() as tmp:
+        monkeypatch.setenv("XDG_STATE_HOME", tmp)
+        monkeypatch.setenv("TELECLAUDE_LOG_LEVEL", "INFO")
+        monkeypatch.delenv("TELECLAUDE_THIRD_PARTY_LOGGERS", raising=False)
+
+        log_path = configure_logging(_APP_NAME, background_writer=True)
+        try:
+            logger = logging.getLogger(_LOGGER_OURS)
+            for _ in range(_BURST_RECORDS):
+                logger.info(_MSG_OURS)
+
+            # No stop(): the listener must flush on its own once it catches up.
+            deadline = time.monotonic() + _FLUSH_TIMEOUT_S
+            while read_log_text(log_path).count(_FIELD_MSG_OURS) < _BURST_RECORDS:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+        finally:
+            iai_logging._stop_background_writer()
+
+
+def test_global_disable_skips_record_creation_below_lowest_configured_level(isolated_logging, monkeypatch):
+    with TemporaryDirectory() as tmp:
+        monkeypatch.setenv("XDG_STATE_HOME", tmp)
+        monkeypatch.setenv("TELECLAUDE_LOG_LEVEL", "INFO")
+        monkeypatch.setenv("TELECLAUDE_THIRD_PARTY_LOG_LEVEL", "WARNING")
+        monkeypatch.delenv("TELECLAUDE_THIRD_PARTY_LOGGERS", raising=False)
+        monkeypatch.delenv("TELECLAUDE_MUTED_LOGGERS", raising=False)
+
+        try:
+            log_path = configure_logging(_APP_NAME, use_global_disable=True)
+            assert logging.root.manager.disable == logging.INFO - 1
+
+            logger = logging.getLogger(_LOGGER_OURS)
+            logger.debug(_MSG_CORE_DEBUG)
+            logger.info(_MSG_OURS)
+
+            content = read_log_text(log_path)
+            assert _MSG_CORE_DEBUG not in content
+            assert _FIELD_MSG_OURS in content
+
+            configure_logging(_APP_NAME)
+            assert logging.root.manager.disable == logging.NOTSET
+        finally:
+            logging.disable(logging.NOTSET)
+
+
+def test_background_writer_survives_a_failing_flush(isolated_logging, monkeypatch):
+    with TemporaryDirectory() as tmp:
+        monkeypatch.setenv("XDG_STATE_HOME", tmp)
+        monkeypatch.setenv("TELECLAUDE_LOG_LEVEL", "INFO")
+        monkeypatch.delenv("TELECLAUDE_THIRD_PARTY_LOGGERS", raising=False)
+
+        handled_errors: list[str] = []
+        real_flush_batch = RotationAwareFileHandler.flush_batch
+        failures = [OSError(28, "No space left on device")]
+
+        def _flaky_flush_batch(self: RotationAwareFileHandler) -> None:
+            if failures:
+                raise failures.pop()
+            real_flush_batch(self)
+
+        def _record_error(self: RotationAwareFileHandler, record: logging.LogRecord) -> None:
+            handled_errors.append(record.getMessage())
+
+        monkeypatch.setattr(RotationAwareFileHandler, "flush_batch", _flaky_flush_batch)
+        monkeypatch.setattr(RotationAwareFileHandler, "handleError", _record_error)
+
+        log_path = configure_logging(_APP_NAME, background_writer=True)
+        try:
+            logger = logging.getLogger(_LOGGER_OURS)
+            logger.info(_MSG_OURS)
+            deadline = time.monotonic() + _FLUSH_TIMEOUT_S
+            while not handled_errors:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+            # The listener must outlive the failed flush and write the next record.
+            logger.info(_MSG_AFTER_FLUSH_ERROR)
+            while _MSG_AFTER_FLUSH_ERROR not in read_log_text(log_path):
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+        finally:
+            iai_logging._stop_background_writer()
+
+        assert handled_errors == [_MSG_OURS]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_background_writer_restarts_in_forked_child(isolated_logging, monkeypatch):
+    with TemporaryDirectory() as tmp:
+        monkeypatch.setenv("XDG_STATE_HOME", tmp)
+        monkeypatch.setenv("TELECLAUDE_LOG_LEVEL", "INFO")
+        monkeypatch.delenv("TELECLAUDE_THIRD_PARTY_LOGGERS", raising=False)
+
+        log_path = configure_logging(_APP_NAME, background_writer=True)
+        try:
+            logger = logging.getLogger(_LOGGER_OURS)
+            logger.info(_MSG_FORK_PARENT)
+
+            pid = os.fork()
+            if pid == 0:
+                # Child: never return into pytest.
+                ok = False
+                try:
+                    logger.info(_MSG_FORK_CHILD)
+                    deadline = time.monotonic() + _FLUSH_TIMEOUT_S
+                    while time.monotonic() < deadline:
+                        if _MSG_FORK_CHILD in read_log_text(log_path):
+                            ok = True
+                            break
+                        time.sleep(0.01)
+                finally:
+                    os._exit(0 if ok else 1)
+
+            _, status = os.waitpid(pid, 0)
+            assert os.waitstatus_to_exitcode(status) == 0
+        finally:
+            iai_logging._stop_background_writer()
+
+        # The parent's record was flushed before the fork, so the child never
+        # writes a second copy of it.
+        assert read_log_text(log_path).count(_FIELD_MSG_FORK_PARENT) == 1
+
+
+def test_failed_reconfigure_keeps_background_writer_running(isolated_logging, monkeypatch):
+    with TemporaryDirectory() as tmp:
+        monkeypatch.setenv("XDG_STATE_HOME", tmp)
+        monkeypatch.setenv("TELECLAUDE_LOG_LEVEL", "INFO")
+        monkeypatch.delenv("TELECLAUDE_THIRD_PARTY_LOGGERS", raising=False)
+
+        log_path = configure_logging(_APP_NAME, background_writer=True)
+        try:
+            not_a_dir = Path(tmp) / "not-a-dir"
+            not_a_dir.write_text("", encoding="utf-8")
+            monkeypatch.setenv("XDG_STATE_HOME", str(not_a_dir))
+            with pytest.raises(NotADirectoryError):
+                configure_logging(_APP_NAME, background_writer=True)
+
+            # The earlier configuration must still be writing, not queueing for a
+            # listener the failed call stopped.
+            logging.getLogger(_LOGGER_OURS).info(_MSG_AFTER_FAILED_RECONFIGURE)
+            deadline = time.monotonic() + _FLUSH_TIMEOUT_S
+            while _MSG_AFTER_FAILED_RECONFIGURE not in read_log_text(log_path):
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+        finally:
+            iai_logging._stop_background_writer()
+
+
+def test_records_logged_after_background_writer_stops_are_written(isolated_logging, monkeypatch):
+    with TemporaryDirectory() as tmp:
+        monkeypatch.setenv("XDG_STATE_HOME", tmp)
+        monkeypatch.setenv("TELECLAUDE_LOG_LEVEL", "INFO")
+        monkeypatch.delenv("TELECLAUDE_THIRD_PARTY_LOGGERS", raising=False)
+
+        log_path = configure_logging(_APP_NAME, background_writer=True)
+        # What the atexit hook does, before later exit hooks may still log.
+        iai_logging._stop_background_writer()
+
+        assert not any(isinstance(h, QueueHandler) for h in logging.root.handlers)
+        logging.getLogger(_LOGGER_OURS).info(_MSG_OURS)
+        assert _FIELD_MSG_OURS in read_log_text(log_path)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+from logging.handlers import WatchedFileHandler
+
+import pytest
+from instrukt_ai_logging import configure_logging
+
+from tests.conftest import read_log_text
+
+# Log markers shared by each test and its assertions — named constants per
+# software-development/procedure/snapshot-testing (no bare literals in content
+# assertions).
+_APP_NAME = "teleclaude"
+_LOGGER_OURS = "teleclaude.core"
+_MSG_BEFORE = "before-rotation"
+_MSG_AFTER = "after-rotation"
+_MSG_STEADY = "steady-state"
+
+
+def test_handler_reopens_after_rename_rotation(isolated_logging):
+    log_path = configure_logging(_APP_NAME)
+    logger = logging.getLogger(_LOGGER_OURS)
+
+    logger.info(_MSG_BEFORE)
+    rotated = log_path.with_name(log_path.name + ".1")
+    log_path.rename(rotated)
+    logger.info(_MSG_AFTER)
+
+    assert _MSG_BEFORE in read_log_text(rotated)
+    assert _MSG_AFTER not in read_log_text(rotated)
+    assert _MSG_AFTER in read_log_text(log_path)
+
+
+def test_handler_recreates_file_after_unlink(isolated_logging):
+    log_path = configure_logging(_APP_NAME)
+    logger = logging.getLogger(_LOGGER_OURS)
+
+    logger.info(_MSG_BEFORE)
+    log_path.unlink()
+    logger.info(_MSG_AFTER)
+
+    assert _MSG_AFTER in read_log_text(log_path)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_handler_skips_stat_check_while_file_is_untouched(isolated_logging, monkeypatch):
+    configure_logging(_APP_NAME)
+    logger = logging.getLogger(_LOGGER_OURS)
+    logger.info(_MSG_BEFORE)  # drain anything queued by creating the file
+
+    checks: list[int] = []
+    real_reopen = WatchedFileHandler.reopenIfNeeded
+
+    def _spy(self: WatchedFileHandler) -> None:
+        checks.append(1)
+        real_reopen(self)
+
+    monkeypatch.setattr(WatchedFileHandler, "reopenIfNeeded", _spy)
+    for _ in range(3):
+        logger.info(_MSG_STEADY)
+
+    assert checks == []
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_reconfigure_closes_previous_handlers_inotify_fd(isolated_logging):
+    configure_logging(_APP_NAME)
+    first = logging.root.handlers[0]
+    watch = first._watch  # pyright: ignore[reportAttributeAccessIssue]
+    assert watch is not None
+    fd = watch.fileno()
+
+    configure_logging(_APP_NAME)
+
+    assert logging.root.handlers[0] is not first
+    with pytest.raises(OSError):
+        os.fstat(fd)
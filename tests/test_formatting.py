@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+
+from instrukt_ai_logging.logging import LogfmtFormatter, UtcMillisFormatter
+
+# Log markers shared by each test and its assertions — named constants per
+# software-development/procedure/snapshot-testing (no bare literals in content
+# assertions).
+_LOGGER_OURS = "teleclaude.core"
+_MAX_CHARS = 4000
+
+_TELEGRAM_TOKEN = "123456:ABCdefGhIJKlmNoPQRstuVWXyz"
+_BEARER_TOKEN = "eyJhbGciOiJIUzI1NiJ9.payload.signature"
+_SK_KEY = "sk-abcdefghij0123456789"
+_MSG_PLAIN = "nothing secret here"
+_MSG_TELEGRAM = f"POST https://api.telegram.org/bot{_TELEGRAM_TOKEN}/sendMessage failed"
+_MSG_MIXED = f"auth=Bearer {_BEARER_TOKEN} key={_SK_KEY}"
+_MSG_TEMPLATE = "token %s"
+
+_REDACTED_TELEGRAM = "api.telegram.org/bot<REDACTED>/sendMessage"
+_REDACTED_BEARER = "Bearer <REDACTED>"
+_REDACTED_SK = "sk-<REDACTED>"
+_FIELD_MSG_PLAIN = f'msg="{_MSG_PLAIN}"'
+
+
+def _record(msg: str, *args: object, kv: dict[str, object] | None = None) -> logging.LogRecord:
+    record = logging.LogRecord(_LOGGER_OURS, logging.INFO, __file__, 1, msg, args or None, None)
+    if kv is not None:
+        record.kv = kv
+    return record
+
+
+def test_redacts_telegram_bot_token_in_message() -> None:
+    line = LogfmtFormatter(max_message_chars=_MAX_CHARS).format(_record(_MSG_TELEGRAM))
+
+    assert _TELEGRAM_TOKEN not in line
+    assert _REDACTED_TELEGRAM in line
+
+
+def test_redacts_bearer_and_sk_tokens_in_one_message() -> None:
+    line = LogfmtFormatter(max_message_chars=_MAX_CHARS).format(_record(_MSG_MIXED))
+
+    assert _BEARER_TOKEN not in line
+    assert _SK_KEY not in line
+    assert _REDACTED_BEARER in line
+    assert _REDACTED_SK in line
+
+
+def test_redacts_secrets_in_kv_values() -> None:
+    line = LogfmtFormatter(max_message_chars=_MAX_CHARS).format(_record(_MSG_PLAIN, kv={"url": _MSG_TELEGRAM}))
+
+    assert _TELEGRAM_TOKEN not in line
+    assert _REDACTED_TELEGRAM in line
+
+
+def test_plain_message_passes_through_unchanged() -> None:
+    line = LogfmtFormatter(max_message_chars=_MAX_CHARS).format(_record(_MSG_PLAIN))
+
+    assert _FIELD_MSG_PLAIN in line
+
+
+def test_redacted_message_is_cached_on_record_for_later_handlers() -> None:
+    record = _record(_MSG_TEMPLATE, _SK_KEY)
+
+    first = LogfmtFormatter(max_message_chars=_MAX_CHARS).format(record)
+
+    # The %-formatted, redacted text replaces msg/args so a second handler on the
+    # same record neither re-formats nor sees the raw secret.
+    assert record.args == ()
+    assert _SK_KEY not in str(record.msg)
+    assert logging.Formatter("%(message)s").format(record) == _MSG_TEMPLATE % _REDACTED_SK
+    assert LogfmtFormatter(max_message_chars=_MAX_CHARS).format(record) == first
+
+
+def test_format_time_reuses_second_prefix_and_tracks_second_changes() -> None:
+    formatter = UtcMillisFormatter()
+    first = _record(_MSG_PLAIN)
+    first.created, first.msecs = 1704207845.123, 123.0
+    same_second = _record(_MSG_PLAIN)
+    same_second.created, same_second.msecs = 1704207845.987, 987.0
+    next_second = _record(_MSG_PLAIN)
+    next_second.created, next_second.msecs = 1704207846.004, 4.0
+
+    assert formatter.formatTime(first) == "2024-01-02T15:04:05.123Z"
+    assert formatter.formatTime(same_second) == "2024-01-02T15:04:05.987Z"
+    assert formatter.formatTime(next_second) == "2024-01-02T15:04:06.004Z"
+    assert formatter.formatTime(first, "%Y") == "2024"
+
+
+def test_plain_message_without_args_leaves_record_untouched() -> None:
+    record = _record(_MSG_PLAIN)
+
+    LogfmtFormatter(max_message_chars=_MAX_CHARS).format(record)
+
+    assert record.msg is _MSG_PLAIN
+    assert record.args is None
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import gc
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from instrukt_ai_logging._inotify import FOLLOW_EVENTS, ROTATION_EVENTS, Inotify
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+
+_WATCHED_FILE = "watched.log"
+_APPENDED = b"appended\n"
+_WAIT_S = 1.0
+
+
+def _watched(tmp_path: Path) -> str:
+    watched = tmp_path / _WATCHED_FILE
+    watched.touch()
+    return os.fspath(watched)
+
+
+def test_drain_reports_nothing_until_the_file_changes(tmp_path: Path) -> None:
+    path = _watched(tmp_path)
+    watch = Inotify.open(path, FOLLOW_EVENTS)
+    assert watch is not None
+    try:
+        assert not watch.drain()
+        with open(path, "ab") as f:
+            f.write(_APPENDED)
+        assert watch.wait(_WAIT_S)
+        assert not watch.drain()
+    finally:
+        watch.close()
+
+
+def test_rewatch_follows_the_path_to_a_new_inode(tmp_path: Path) -> None:
+    path = _watched(tmp_path)
+    watch = Inotify.open(path, ROTATION_EVENTS)
+    assert watch is not None
+    try:
+        os.rename(path, path + ".1")
+        assert watch.wait(_WAIT_S)
+        _watched(tmp_path)
+        assert watch.rewatch(path)
+        os.unlink(path)
+        assert watch.wait(_WAIT_S)
+    finally:
+        watch.close()
+
+
+def test_dropped_inotify_watch_closes_its_fd(tmp_path: Path) -> None:
+    watch = Inotify.open(_watched(tmp_path), ROTATION_EVENTS)
+    assert watch is not None
+    fd = watch.fileno()
+
+    del watch
+    gc.collect()
+
+    with pytest.raises(OSError):
+        os.fstat(fd)
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+from instrukt_ai_logging._reading import iter_recent_log_lines, iter_recent_log_lines_merged, parse_log_timestamp
+from instrukt_ai_logging.logging import resolve_log_files
+
+# Log markers shared by each fixture and its assertions — named constants per
+# software-development/procedure/snapshot-testing (no bare literals in content
+# assertions).
+_MSG_FRESH = "fresh"
+_MSG_BOOM = "boom"
+_MSG_AFTER = "after"
+_TRACEBACK_LINE = "  Traceback (most recent call last):"
+_FILE_LINE = "  File 'foo.py', line 1"
+_MSG_INFO = "info-line"
+_MSG_CRON = "cron-line"
+_MSG_DAEMON = "daemon-line"
+_MSG_OLD_PREFIX = "msg=old-"
+_MSG_LINE_PREFIX = "msg=line-"
+_LARGE_LINE_COUNT = 20000
+# Enough lines to span several 1 MiB scan reads.
+_MULTI_CHUNK_LINE_COUNT = 40000
+
+
+@pytest.fixture()
+def app_log_dir(monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    tmp = TemporaryDirectory()
+    root = Path(tmp.name)
+    monkeypatch.setenv("XDG_STATE_HOME", str(root))
+
+    app_dir = root / "instrukt-ai" / "demo-app"
+    app_dir.mkdir(parents=True)
+    yield app_dir
+    tmp.cleanup()
+
+
+def _now_iso(offset_minutes: int = 0) -> str:
+    dt = datetime.now(tz=UTC) + timedelta(minutes=offset_minutes)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S") + f".{int(dt.microsecond / 1000):03d}Z"
+
+
+def test_iter_recent_log_lines_merged_orders_by_timestamp_across_files(
+    app_log_dir: Path,
+) -> None:
+    cron = app_log_dir / "cron.log"
+    daemon = app_log_dir / "demo-app.log"
+
+    cron.write_text(
+        f"{_now_iso(-3)} level=INFO logger=demo.cron msg=cron-A\n"
+        f"{_now_iso(-1)} level=INFO logger=demo.cron msg=cron-B\n",
+        encoding="utf-8",
+    )
+    daemon.write_text(
+        f"{_now_iso(-2)} level=INFO logger=demo.daemon msg=daemon-A\n"
+        f"{_now_iso(0)} level=INFO logger=demo.daemon msg=daemon-B\n",
+        encoding="utf-8",
+    )
+
+    files = resolve_log_files("demo-app")
+    lines = list(iter_recent_log_lines_merged(files, since=timedelta(minutes=10)))
+    msgs = [line.strip().rsplit("=", 1)[-1] for line in lines]
+    assert msgs == ["cron-A", "daemon-A", "cron-B", "daemon-B"]
+
+
+def test_iter_recent_log_lines_merged_respects_since_cutoff(app_log_dir: Path) -> None:
+    daemon = app_log_dir / "demo-app.log"
+    daemon.write_text(
+        f"{_now_iso(-30)} level=INFO logger=demo.daemon msg=old\n"
+        f"{_now_iso(-1)} level=INFO logger=demo.daemon msg={_MSG_FRESH}\n",
+        encoding="utf-8",
+    )
+
+    files = resolve_log_files("demo-app")
+    lines = list(iter_recent_log_lines_merged(files, since=timedelta(minutes=5)))
+    assert len(lines) == 1
+    assert _MSG_FRESH in lines[0]
+
+
+def test_iter_recent_log_lines_merged_orders_second_precision_stamps_with_canonical(
+    app_log_dir: Path,
+) -> None:
+    cron = app_log_dir / "cron.log"
+    daemon = app_log_dir / "demo-app.log"
+    # A seconds-only stamp is keyed as its canonical `.000Z` form, so it sorts
+    # against millisecond stamps from other files by plain string comparison.
+    seconds_only = (datetime.now(UTC) - timedelta(minutes=2)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    cron.write_text(f"{seconds_only} level=INFO logger=demo.cron msg={_MSG_CRON}\n", encoding="utf-8")
+    daemon.write_text(
+        f"{_now_iso(-3)} level=INFO logger=demo.daemon msg={_MSG_INFO}\n"
+        f"{_now_iso(-1)} level=INFO logger=demo.daemon msg={_MSG_DAEMON}\n",
+        encoding="utf-8",
+    )
+
+    files = resolve_log_files("demo-app")
+    lines = list(iter_recent_log_lines_merged(files, since=timedelta(minutes=10)))
+    msgs = [line.strip().rsplit("=", 1)[-1] for line in lines]
+    assert msgs == [_MSG_INFO, _MSG_CRON, _MSG_DAEMON]
+
+
+def test_iter_recent_log_lines_merged_skips_files_with_mtime_before_cutoff(
+    app_log_dir: Path,
+) -> None:
+    import os
+
+    fresh = app_log_dir / "demo-app.log"
+    fresh.write_text(
+        f"{_now_iso(-1)} level=INFO logger=demo.daemon msg=fresh\n",
+        encoding="utf-8",
+    )
+    stale = app_log_dir / "stale.log"
+    stale.write_text(
+        f"{_now_iso(-1)} level=INFO logger=stale msg=stale-but-line-looks-recent\n",
+        encoding="utf-8",
+    )
+    # Force stale.log's mtime to 1 day ago — older than --since=10m cutoff.
+    one_day_ago = (datetime.now(tz=UTC) - timedelta(days=1)).timestamp()
+    os.utime(stale, (one_day_ago, one_day_ago))
+
+    files = resolve_log_files("demo-app")
+    lines = list(iter_recent_log_lines_merged(files, since=timedelta(minutes=10)))
+    msgs = [line.strip().rsplit("=", 1)[-1] for line in lines]
+    assert msgs == ["fresh"]
+
+
+def test_iter_recent_log_lines_merged_keeps_continuation_lines_with_parent(
+    app_log_dir: Path,
+) -> None:
+    daemon = app_log_dir / "demo-app.log"
+    daemon.write_text(
+        f"{_now_iso(-1)} level=ERROR logger=demo.daemon msg={_MSG_BOOM}\n"
+        f"{_TRACEBACK_LINE}\n"
+        f"{_FILE_LINE}\n"
+        f"{_now_iso(0)} level=INFO logger=demo.daemon msg={_MSG_AFTER}\n",
+        encoding="utf-8",
+    )
+
+    files = resolve_log_files("demo-app")
+    lines = list(iter_recent_log_lines_merged(files, since=timedelta(minutes=10)))
+    assert len(lines) == 4
+    assert _MSG_BOOM in lines[0]
+    assert lines[1].startswith(_TRACEBACK_LINE)
+    assert lines[2].startswith(_FILE_LINE)
+    assert _MSG_AFTER in lines[3]
+
+
+def test_iter_recent_log_lines_merged_reads_tail_window_of_large_file(
+    app_log_dir: Path,
+) -> None:
+    # A large body of old lines (well past the 256 KiB backward probe) followed by
+    # a recent window that includes a multi-line entry. The reader must return only
+    # the recent lines — proving it locates the window near EOF rather than scanning
+    # the whole file — and must keep the continuation line with its parent across
+    # the seek boundary.
+    daemon = app_log_dir / "demo-app.log"
+    old_block = "".join(
+        f"{_now_iso(-30)} level=INFO logger=demo.daemon {_MSG_OLD_PREFIX}{i}\n" for i in range(_LARGE_LINE_COUNT)
+    )
+    recent_block = (
+        f"{_now_iso(-1)} level=ERROR logger=demo.daemon msg={_MSG_BOOM}\n"
+        f"{_TRACEBACK_LINE}\n"
+        f"{_now_iso(0)} level=INFO logger=demo.daemon msg={_MSG_AFTER}\n"
+    )
+    daemon.write_text(old_block + recent_block, encoding="utf-8")
+    assert daemon.stat().st_size > 262144  # forces the backward-probe path (offset > 0)
+
+    files = resolve_log_files("demo-app")
+    lines = list(iter_recent_log_lines_merged(files, since=timedelta(minutes=5)))
+    assert len(lines) == 3
+    assert _MSG_BOOM in lines[0]
+    assert lines[1].startswith(_TRACEBACK_LINE)
+    assert _MSG_AFTER in lines[2]
+    assert all(_MSG_OLD_PREFIX not in line for line in lines)
+
+
+def test_iter_recent_log_lines_merged_returns_whole_large_file_within_window(
+    app_log_dir: Path,
+) -> None:
+    # Every line is inside the window but the file exceeds one probe: the backward
+    # probe must grow to the file start (offset 0) and return all lines, not just
+    # the final probe's worth.
+    daemon = app_log_dir / "demo-app.log"
+    daemon.write_text(
+        "".join(
+            f"{_now_iso(-1)} level=INFO logger=demo.daemon {_MSG_LINE_PREFIX}{i}\n" for i in range(_LARGE_LINE_COUNT)
+        ),
+        encoding="utf-8",
+    )
+    assert daemon.stat().st_size > 262144
+
+    files = resolve_log_files("demo-app")
+    lines = list(iter_recent_log_lines_merged(files, since=timedelta(minutes=5)))
+    assert len(lines) == _LARGE_LINE_COUNT
+    first_marker = f"{_MSG_LINE_PREFIX}0"
+    last_marker = f"{_MSG_LINE_PREFIX}{_LARGE_LINE_COUNT - 1}"
+    assert first_marker in lines[0]
+    assert last_marker in lines[-1]
+
+
+def test_iter_recent_log_lines_yields_window_across_rotated_siblings(
+    app_log_dir: Path,
+) -> None:
+    import os
+
+    rotated = app_log_dir / "demo-app.log.1"
+    rotated.write_text(
+        f"{_now_iso(-30)} level=INFO logger=demo.daemon msg=old\n"
+        f"{_now_iso(-3)} level=INFO logger=demo.daemon msg=rotated-A\n",
+        encoding="utf-8",
+    )
+    two_minutes_ago = (datetime.now(tz=UTC) - timedelta(minutes=2)).timestamp()
+    os.utime(rotated, (two_minutes_ago, two_minutes_ago))
+    stale = app_log_dir / "demo-app.log.2"
+    stale.write_text(f"{_now_iso(-1)} level=INFO logger=demo.daemon msg=stale\n", encoding="utf-8")
+    one_day_ago = (datetime.now(tz=UTC) - timedelta(days=1)).timestamp()
+    os.utime(stale, (one_day_ago, one_day_ago))
+    (app_log_dir / "demo-app.log").write_text(
+        f"{_now_iso(-1)} level=INFO logger=demo.daemon msg=live-A\n",
+        encoding="utf-8",
+    )
+
+    lines = iter_recent_log_lines(app_log_dir / "demo-app.log", since=timedelta(minutes=10))
+    assert isinstance(lines, Iterator)
+    msgs = [line.strip().rsplit("=", 1)[-1] for line in lines]
+    assert msgs == ["rotated-A", "live-A"]
+
+
+def test_iter_recent_log_lines_scans_tail_window_of_large_file(app_log_dir: Path) -> None:
+    daemon = app_log_dir / "demo-app.log"
+    old_block = "".join(
+        f"{_now_iso(-30)} level=INFO logger=demo.daemon {_MSG_OLD_PREFIX}{i}\n" for i in range(_LARGE_LINE_COUNT)
+    )
+    recent_block = (
+        f"{_now_iso(-1)} level=ERROR logger=demo.daemon msg={_MSG_BOOM}\n"
+        f"{_TRACEBACK_LINE}\n"
+        f"{_now_iso(0)} level=INFO logger=demo.daemon msg={_MSG_AFTER}"
+    )
+    daemon.write_text(old_block + recent_block, encoding="utf-8")
+
+    lines = list(iter_recent_log_lines(daemon, since=timedelta(minutes=5)))
+    # Only timestamped lines are yielded; the final line has no trailing newline.
+    assert len(lines) == 2
+    assert _MSG_BOOM in lines[0]
+    assert lines[1].rstrip("\n").endswith(f"msg={_MSG_AFTER}")
+
+
+def _write_in_window_lines(path: Path, count: int) -> None:
+    stamp = _now_iso(-1)
+    path.write_text(
+        "".join(f"{stamp} level=INFO logger=demo.daemon {_MSG_LINE_PREFIX}{i}\n" for i in range(count)),
+        encoding="utf-8",
+    )
+
+
+def test_iter_recent_log_lines_yields_every_line_across_read_chunks(app_log_dir: Path) -> None:
+    daemon = app_log_dir / "demo-app.log"
+    _write_in_window_lines(daemon, _MULTI_CHUNK_LINE_COUNT)
+
+    lines = list(iter_recent_log_lines(daemon, since=timedelta(minutes=5)))
+
+    assert len(lines) == _MULTI_CHUNK_LINE_COUNT
+    assert lines[-1].rstrip("\n").endswith(f"{_MSG_LINE_PREFIX}{_MULTI_CHUNK_LINE_COUNT - 1}")
+
+
+def test_iter_recent_log_lines_survives_truncation_mid_iteration(app_log_dir: Path) -> None:
+    daemon = app_log_dir / "demo-app.log"
+    _write_in_window_lines(daemon, _MULTI_CHUNK_LINE_COUNT)
+
+    lines = iter_recent_log_lines(daemon, since=timedelta(minutes=5))
+    first = next(lines)
+    os.truncate(daemon, 0)  # `: > app.log` / logrotate copytruncate
+    rest = list(lines)
+
+    assert _MSG_LINE_PREFIX in first
+    assert len(rest) < _MULTI_CHUNK_LINE_COUNT - 1
+
+
+def test_iter_recent_log_lines_yields_nothing_when_dir_missing(app_log_dir: Path) -> None:
+    missing = app_log_dir / "gone" / "demo-app.log"
+
+    assert list(iter_recent_log_lines(missing, since=timedelta(minutes=10))) == []
+
+
+def test_parse_log_timestamp_handles_canonical_and_generic_shapes() -> None:
+    canonical = parse_log_timestamp("2024-01-02T15:04:05.123Z level=INFO msg=x\n")
+    no_millis = parse_log_timestamp("2024-01-02T15:04:05Z level=INFO msg=x\n")
+
+    assert canonical == datetime(2024, 1, 2, 15, 4, 5, 123000, tzinfo=UTC)
+    assert no_millis == datetime(2024, 1, 2, 15, 4, 5, tzinfo=UTC)
+    assert parse_log_timestamp(f"{_TRACEBACK_LINE}\n") is None
+    assert parse_log_timestamp("2024-13-02T15:04:05.123Z level=INFO\n") is None